@@ -19,10 +19,14 @@ def run_in_wt_pane(command: str, pane_index: int = 0) -> None:
         str(pane_index),
         "pwsh",
         "-NoLogo",
+        "-NoProfile",
         "-Command",
         command,
     ]
-    subprocess.run(wt_command, shell=True)
+    subprocess.run(
+        wt_command,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
 
 
 def team_dev():
@@ -1,10 +1,19 @@
 """Adapter package for platform-specific implementations."""
 
+from __future__ import annotations
+import importlib
+from typing import Any
+
 from .base import BaseAdapter, AdapterRegistry, AdapterInfo, ShellType
-from .terminal import TerminalAdapter
-from .powershell import PowerShellAdapter
-from .cmd import CMDAdapter
-from .wsl import WSLAdapter
+
+# Concrete adapters are imported on first use so a run that only needs
+# one shell does not pay for parsing the others.
+_LAZY_ADAPTERS = {
+    "TerminalAdapter": ".terminal",
+    "PowerShellAdapter": ".powershell",
+    "CMDAdapter": ".cmd",
+    "WSLAdapter": ".wsl",
+}
 
 __all__ = [
     "BaseAdapter",
@@ -16,3 +25,16 @@ __all__ = [
     "CMDAdapter",
     "WSLAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
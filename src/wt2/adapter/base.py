@@ -7,6 +7,7 @@ must implement.
 
 from __future__ import annotations
 import abc
+import importlib
 from typing import Optional, Dict, Any, List, Type, TypeVar, ClassVar
 from dataclasses import dataclass
 from enum import Enum
@@ -41,6 +42,15 @@ class AdapterInfo:
 
 T = TypeVar("T", bound="BaseAdapter")
 
+# Module that registers the adapter for each shell type on import
+_ADAPTER_MODULES: Dict[ShellType, str] = {
+    ShellType.WINDOWS_TERMINAL: "wt2.adapter.terminal",
+    ShellType.POWERSHELL: "wt2.adapter.powershell",
+    ShellType.POWERSHELL_CORE: "wt2.adapter.powershell",
+    ShellType.CMD: "wt2.adapter.cmd",
+    ShellType.WSL: "wt2.adapter.wsl",
+}
+
 
 class BaseAdapter(abc.ABC):
     """
@@ -80,6 +90,8 @@ class BaseAdapter(abc.ABC):
         Returns:
             Adapter class or None if not found.
         """
+        if shell_type not in cls._registry and shell_type in _ADAPTER_MODULES:
+            importlib.import_module(_ADAPTER_MODULES[shell_type])
         return cls._registry.get(shell_type)
 
     @classmethod
@@ -105,7 +117,7 @@ class BaseAdapter(abc.ABC):
     @classmethod
     def get_available_adapters(cls) -> List[ShellType]:
         """Get list of available (registered) adapters."""
-        return list(cls._registry.keys())
+        return list(dict.fromkeys([*cls._registry, *_ADAPTER_MODULES]))
 
     @property
     @abc.abstractmethod
@@ -7,13 +7,58 @@ Provides integration with Windows Command Prompt (cmd.exe).
 from __future__ import annotations
 import subprocess
 import os
+import queue
 import re
+import shutil
+import stat
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
 from .base import BaseAdapter, AdapterInfo, ShellType
 
 
+# Variable holding the user's PROMPT in the persistent shell
+_SAVED_PROMPT = "__WT2_PROMPT"
+
+
+def _merge_env(env: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """
+    Build the child environment for a subprocess.
+
+    Returns None when there are no overrides so the child inherits the
+    parent environment without copying it.
+    """
+    if not env:
+        return None
+    return {**os.environ, **env}
+
+
+def _quote(arg: str) -> str:
+    """Quote a single argument for cmd.exe."""
+    return '"' + arg.replace('"', '""') + '"'
+
+
+def _join(*parts: str) -> str:
+    """Join command fragments, skipping empty ones."""
+    return " ".join(part for part in parts if part)
+
+
+# A bare "C:" line in `wmic logicaldisk get name` output
+_DRIVE_LINE_RE = re.compile(r"^\s*(\S:)\s*$", re.MULTILINE)
+
+
+def _is_hidden(entry: os.DirEntry) -> bool:
+    """Check whether a directory entry has the hidden attribute."""
+    attributes = getattr(entry.stat(follow_symlinks=False), "st_file_attributes", None)
+    if attributes is None:
+        return entry.name.startswith(".")
+    return bool(attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+
+
 class CMDAdapter(BaseAdapter):
     """
     Adapter for Windows Command Prompt (cmd.exe).
@@ -39,27 +84,71 @@ class CMDAdapter(BaseAdapter):
         self._executable = executable or "cmd.exe"
         self._timeout = timeout
         self._encoding = encoding
+        self._available: Optional[bool] = None
+        self._info_cache: Optional[AdapterInfo] = None
+        self._proc: Optional[subprocess.Popen] = None
+        self._output: Optional[queue.Queue] = None
+        self._lock = threading.Lock()
+        self._env_cache: Dict[tuple, Dict[str, str]] = {}
+        self._spawn_kwargs = self._hidden_window_kwargs()
+        self._sessions: Dict[str, subprocess.Popen] = {}
+
+    @staticmethod
+    def _hidden_window_kwargs() -> Dict[str, Any]:
+        """Build subprocess kwargs that skip console window allocation."""
+        if os.name != "nt":
+            return {}
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        return {
+            "startupinfo": startupinfo,
+            "creationflags": subprocess.CREATE_NO_WINDOW,
+        }
 
     @property
     def info(self) -> AdapterInfo:
-        """Get adapter information."""
-        return AdapterInfo(
-            name="Windows Command Prompt",
-            shell_type=ShellType.CMD,
-            version="10.0",
-            is_available=self.is_available(),
-            executable_path=self._executable,
-            default_args=["/K", "echo winterm2 CMD adapter loaded"],
-        )
+        """Get adapter information (built once, see refresh_info)."""
+        if self._info_cache is None:
+            self._info_cache = AdapterInfo(
+                name="Windows Command Prompt",
+                shell_type=ShellType.CMD,
+                version="10.0",
+                is_available=self.is_available(),
+                executable_path=self._executable,
+                default_args=["/K", "echo winterm2 CMD adapter loaded"],
+            )
+        return self._info_cache
+
+    def refresh_info(self) -> None:
+        """Discard cached adapter information and availability."""
+        self._info_cache = None
+        self._available = None
+
+    def is_available(self, deep: bool = False) -> bool:
+        """
+        Check if CMD is available.
+
+        Args:
+            deep: Actually run cmd.exe instead of only locating it.
+
+        Returns:
+            True if CMD is available.
+        """
+        if deep:
+            return self._probe()
+        if self._available is None:
+            self._available = shutil.which(self._executable) is not None
+        return self._available
 
-    def is_available(self) -> bool:
-        """Check if CMD is available."""
+    def _probe(self) -> bool:
+        """Run cmd.exe once to verify it is usable."""
         try:
             result = subprocess.run(
                 [self._executable, "/C", "echo test"],
                 capture_output=True,
-                text=True,
                 timeout=5,
+                **self._spawn_kwargs,
             )
             return result.returncode == 0
         except Exception:
@@ -84,6 +173,9 @@ class CMDAdapter(BaseAdapter):
         Returns:
             Response with stdout, stderr, and exit code.
         """
+        # Any command may change the shell's variables
+        self._env_cache.clear()
+
         if not self.is_available():
             return {
                 "success": False,
@@ -92,10 +184,60 @@ class CMDAdapter(BaseAdapter):
                 "exit_code": 1,
             }
 
-        # Build environment
-        execution_env = os.environ.copy()
-        if env:
-            execution_env.update(env)
+        # The persistent shell has a fixed environment and directory, so
+        # calls that override either still get a dedicated process.
+        if cwd is None and env is None:
+            result = self._execute_persistent(command, timeout or self._timeout)
+            if result is not None:
+                return result
+
+        return self._execute_once(command, cwd, env, timeout)
+
+    def execute_many(
+        self,
+        commands: List[str],
+        stop_on_error: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several CMD commands through a single shell.
+
+        Args:
+            commands: Commands to execute in order.
+            stop_on_error: Skip the remaining commands after a failure.
+            timeout: Per-command timeout.
+
+        Returns:
+            One response per executed command.
+        """
+        self._env_cache.clear()
+        if not commands:
+            return []
+
+        if self.is_available():
+            results = self._run_persistent(
+                list(commands), timeout or self._timeout, stop_on_error
+            )
+            if results is not None:
+                return results
+
+        results = []
+        for command in commands:
+            result = self._execute_once(command, timeout=timeout)
+            results.append(result)
+            if stop_on_error and not result["success"]:
+                break
+        return results
+
+    def _execute_once(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Execute a command in a fresh ``cmd.exe /C`` process."""
+        execution_env = _merge_env(env)
 
         # Wrap command with /C for one-time execution
         cmd = f"/C {command}"
@@ -104,16 +246,16 @@ class CMDAdapter(BaseAdapter):
             result = subprocess.run(
                 [self._executable, "/Q", cmd],
                 capture_output=True,
-                text=True,
                 timeout=timeout or self._timeout,
                 cwd=cwd,
                 env=execution_env,
+                **self._spawn_kwargs,
             )
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": self._decode(result.stdout),
+                "stderr": self._decode(result.stderr),
                 "exit_code": result.returncode,
             }
         except subprocess.TimeoutExpired:
@@ -131,6 +273,168 @@ class CMDAdapter(BaseAdapter):
                 "exit_code": 1,
             }
 
+    def _decode(self, data: bytes) -> str:
+        """Decode raw process output in one pass, normalizing line endings."""
+        return data.decode(self._encoding, errors="replace").replace("\r\n", "\n")
+
+    def _ensure_shell(self) -> Optional[subprocess.Popen]:
+        """Start the long-lived ``cmd.exe /K`` process if it is not running."""
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+
+        try:
+            proc = subprocess.Popen(
+                # Keep the user's prompt readable before quietening it
+                [self._executable, "/Q", "/K", f"set {_SAVED_PROMPT}=%PROMPT%& prompt $G"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                **self._spawn_kwargs,
+            )
+        except Exception:
+            self._proc = None
+            return None
+
+        output: queue.Queue = queue.Queue()
+
+        decode = self._decode
+
+        def _reader() -> None:
+            for line in proc.stdout:
+                output.put(decode(line))
+            output.put(None)
+
+        threading.Thread(target=_reader, daemon=True).start()
+        self._proc = proc
+        self._output = output
+        return proc
+
+    def _execute_persistent(
+        self,
+        command: str,
+        timeout: float,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute a command in the long-lived CMD process.
+
+        Returns:
+            Response dict, or None if the persistent shell could not be
+            started and the caller should fall back to a one-shot process.
+        """
+        results = self._run_persistent([command], timeout, stop_on_error=False)
+        return results[0] if results else None
+
+    def _run_persistent(
+        self,
+        commands: List[str],
+        timeout: float,
+        stop_on_error: bool,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run commands in the long-lived CMD process, one line each.
+
+        Each command is followed by its own sentinel echo so that
+        ``%errorlevel%`` is expanded after the command has finished. Its
+        input comes from ``nul`` so that ``set /p``, ``pause`` or ``more``
+        cannot swallow the sentinel line.
+
+        Returns:
+            One response dict per command that ran, or None if the shell
+            could not be started or fed before any command ran.
+        """
+        with self._lock:
+            proc = self._ensure_shell()
+            if proc is None:
+                return None
+
+            results: List[Dict[str, Any]] = []
+            # Without short-circuiting, all commands are written up front
+            batch = [commands] if not stop_on_error else [[c] for c in commands]
+            for chunk in batch:
+                sentinels = []
+                payload = []
+                for command in chunk:
+                    sentinel = f"__WT2_END_{uuid.uuid4().hex}__"
+                    sentinels.append(sentinel)
+                    payload.append(f"({command}) <nul\r\necho {sentinel} %errorlevel%\r\n")
+                try:
+                    proc.stdin.write("".join(payload).encode(self._encoding))
+                    proc.stdin.flush()
+                except (OSError, ValueError):
+                    self._close_shell()
+                    return results or None
+
+                for sentinel in sentinels:
+                    result = self._read_until(sentinel, time.monotonic() + timeout)
+                    results.append(result)
+                    if self._proc is None:
+                        # Timed out or exited; the shell has been torn down
+                        return results
+                    if stop_on_error and not result["success"]:
+                        return results
+            return results
+
+    def _read_until(self, sentinel: str, deadline: float) -> Dict[str, Any]:
+        """
+        Collect shell output up to ``sentinel`` and parse its exit code.
+
+        Args:
+            sentinel: Marker echoed after the command.
+            deadline: ``time.monotonic()`` value by which the whole command
+                must have finished.
+        """
+        lines: List[str] = []
+        get_line = self._output.get
+        append = lines.append
+        while True:
+            try:
+                line = get_line(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._close_shell()
+                return {
+                    "success": False,
+                    "stdout": "".join(lines),
+                    "stderr": "Command timed out",
+                    "exit_code": -1,
+                }
+            if line is None:
+                # Shell exited (e.g. the command was ``exit``); the command
+                # may have had side effects, so it is not run again.
+                self._close_shell()
+                return {
+                    "success": False,
+                    "stdout": "".join(lines),
+                    "stderr": "Shell exited before the command finished",
+                    "exit_code": -1,
+                }
+            if line.startswith(sentinel):
+                try:
+                    exit_code = int(line[len(sentinel):].strip())
+                except ValueError:
+                    exit_code = 1
+                return {
+                    "success": exit_code == 0,
+                    "stdout": "".join(lines),
+                    "stderr": "",
+                    "exit_code": exit_code,
+                }
+            append(line)
+
+    def _close_shell(self) -> None:
+        """Terminate the long-lived CMD process."""
+        proc, self._proc, self._output = self._proc, None, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+                proc.wait(timeout=2)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Release the persistent CMD process."""
+        with self._lock:
+            self._close_shell()
+
     def start_session(
         self,
         cwd: Optional[str] = None,
@@ -144,16 +448,11 @@ class CMDAdapter(BaseAdapter):
             env: Environment variables.
 
         Returns:
-            Session identifier (process ID).
+            Session identifier.
         """
-        import uuid
-
         session_id = str(uuid.uuid4())
 
-        # Build environment
-        execution_env = os.environ.copy()
-        if env:
-            execution_env.update(env)
+        execution_env = _merge_env(env)
 
         # Start interactive process
         process = subprocess.Popen(
@@ -164,33 +463,29 @@ class CMDAdapter(BaseAdapter):
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            **self._spawn_kwargs,
         )
 
-        return f"{session_id}:{process.pid}"
+        self._sessions[session_id] = process
+        return session_id
 
     def end_session(self, session_id: str) -> bool:
         """
         End a CMD session.
 
         Args:
-            session_id: Session identifier (format: "uuid:pid").
+            session_id: Session identifier.
 
         Returns:
             True if successful.
         """
-        try:
-            parts = session_id.split(":")
-            if len(parts) == 2:
-                pid = int(parts[1])
-                # Terminate the process
-                import ctypes
-                PROCESS_TERMINATE = 1
-                handle = ctypes.windll.kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
-                if handle:
-                    ctypes.windll.kernel32.TerminateProcess(handle, 0)
-                    ctypes.windll.kernel32.CloseHandle(handle)
-                    return True
+        process = self._sessions.pop(session_id, None)
+        if process is None:
             return False
+        try:
+            process.terminate()
+            process.wait(timeout=2)
+            return True
         except Exception:
             return False
 
@@ -211,8 +506,15 @@ class CMDAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        # Simplified - requires maintaining process handles
-        return True
+        process = self._sessions.get(session_id)
+        if process is None or process.poll() is not None:
+            return False
+        try:
+            process.stdin.write(text)
+            process.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
 
     def get_prompt(self, session_id: str) -> str:
         """
@@ -224,8 +526,7 @@ class CMDAdapter(BaseAdapter):
         Returns:
             Prompt string.
         """
-        result = self.execute("echo %prompt%")
-        return result.get("stdout", "C:\\> ").strip()
+        return self._query_state(["prompt"]).get("prompt") or "C:\\> "
 
     def resize_terminal(
         self,
@@ -262,10 +563,15 @@ class CMDAdapter(BaseAdapter):
         Returns:
             Dictionary of variables.
         """
-        result = self.execute("echo %PATH%")
-        if result["success"]:
-            return {"PATH": result["stdout"]}
-        return {}
+        keys = variables or ("PATH",)
+        cached = self._env_cache.get(keys)
+        if cached is not None:
+            return dict(cached)
+
+        values = self._query_state(list(keys))
+        if values:
+            self._env_cache[keys] = values
+        return dict(values)
 
     def set_environment(
         self,
@@ -282,11 +588,13 @@ class CMDAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        for key, value in variables.items():
-            command = f'set {key}={value}'
-            if not self.execute(command)["success"]:
-                return False
-        return True
+        if not variables:
+            return True
+        # One batched `set` line; the values persist in the long-lived shell
+        command = " && ".join(
+            "set " + _quote(f"{key}={value}") for key, value in variables.items()
+        )
+        return self.execute(command)["success"]
 
     def get_working_directory(self, session_id: str) -> str:
         """
@@ -298,10 +606,7 @@ class CMDAdapter(BaseAdapter):
         Returns:
             Current working directory.
         """
-        result = self.execute("echo %CD%")
-        if result["success"]:
-            return result["stdout"].strip()
-        return ""
+        return self._query_state(["CD"]).get("CD", "")
 
     def change_directory(self, session_id: str, path: str) -> bool:
         """
@@ -314,8 +619,7 @@ class CMDAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        command = f'cd /D "{path}"'
-        return self.execute(command)["success"]
+        return self.execute(_join("cd", "/D", _quote(path)))["success"]
 
     def clear_screen(self, session_id: str) -> bool:
         """
@@ -339,14 +643,78 @@ class CMDAdapter(BaseAdapter):
         Returns:
             Exit code or None.
         """
-        result = self.execute("echo %errorlevel%")
-        if result["success"]:
+        value = self._query_state(["errorlevel"]).get("errorlevel")
+        if value is not None:
             try:
-                return int(result["stdout"].strip())
+                return int(value)
             except ValueError:
                 pass
         return None
 
+    def get_state(self, session_id: str, *variables: str) -> Dict[str, str]:
+        """
+        Read several shell variables with a single command.
+
+        Args:
+            session_id: Session identifier.
+            *variables: Variable names (e.g. "CD", "errorlevel", "PATH").
+
+        Returns:
+            Dictionary of variable names to values.
+        """
+        return self._query_state(list(variables))
+
+    def snapshot(self, session_id: str) -> Dict[str, Any]:
+        """
+        Collect working directory, prompt, exit code and drives at once.
+
+        Shell variables come from one batched query; the drive list is
+        gathered concurrently since it does not go through the shell.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            Dictionary with "cwd", "prompt", "exit_code" and "drives".
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            drives = executor.submit(self.get_drive_list)
+            state = executor.submit(self._query_state, ["CD", "prompt", "errorlevel"])
+
+        values = state.result()
+        try:
+            exit_code: Optional[int] = int(values["errorlevel"])
+        except (KeyError, ValueError):
+            exit_code = None
+        return {
+            "cwd": values.get("CD", ""),
+            "prompt": values.get("prompt") or "C:\\> ",
+            "exit_code": exit_code,
+            "drives": drives.result(),
+        }
+
+    def _query_state(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Echo ``%key%`` for every key in one command and split the result.
+
+        ``prompt`` reads the prompt saved before the persistent shell
+        replaced it, and undefined variables, which cmd leaves as a literal
+        ``%key%``, map to "".
+        """
+        if not keys:
+            return {}
+        names = [_SAVED_PROMPT if key.lower() == "prompt" else key for key in keys]
+        result = self.execute("echo " + "^|".join(f"%{name}%" for name in names))
+        if not result["success"]:
+            return {}
+        parts = result["stdout"].strip().split("|")
+        if len(parts) != len(keys):
+            return {}
+        return {
+            key: "" if part == f"%{name}%" else part
+            for key, name, part in zip(keys, names, parts)
+        }
+
     def kill_session(self, session_id: str, signal: int = 9) -> bool:
         """
         Kill a session.
@@ -358,7 +726,15 @@ class CMDAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        return self.end_session(session_id)
+        process = self._sessions.pop(session_id, None)
+        if process is None:
+            return False
+        try:
+            process.kill()
+            process.wait(timeout=2)
+            return True
+        except Exception:
+            return False
 
     # CMD-specific methods
 
@@ -392,8 +768,8 @@ class CMDAdapter(BaseAdapter):
             }
 
         # Build command
-        script_args = " ".join(args) if args else ""
-        command = f'call "{script_path}" {script_args}'
+        script_args = subprocess.list2cmdline(args) if args else ""
+        command = _join("call", _quote(script_path), script_args)
 
         return self.execute(command, cwd=cwd, env=env, timeout=timeout)
 
@@ -404,14 +780,18 @@ class CMDAdapter(BaseAdapter):
         Returns:
             List of drive letters (e.g., ["C:", "D:", "E:"]).
         """
+        try:
+            import ctypes
+
+            mask = ctypes.windll.kernel32.GetLogicalDrives()
+            return [f"{chr(65 + i)}:" for i in range(26) if mask & (1 << i)]
+        except (AttributeError, OSError):
+            pass
+
+        # Fall back to WMI if kernel32 is unreachable
         result = self.execute("wmic logicaldisk get name")
         if result["success"]:
-            drives = []
-            for line in result["stdout"].split("\n"):
-                line = line.strip()
-                if len(line) == 2 and line[1] == ":":
-                    drives.append(line)
-            return drives
+            return _DRIVE_LINE_RE.findall(result["stdout"])
         return []
 
     def get_directory_contents(
@@ -429,90 +809,105 @@ class CMDAdapter(BaseAdapter):
         Returns:
             List of file/directory information.
         """
-        cmd = 'dir /A' + ('H' if show_hidden else '') + ' /N "' + path + '"'
-        result = self.execute(cmd)
-
-        if not result["success"]:
-            return []
-
-        items = []
-        lines = result["stdout"].split("\n")
-
-        for line in lines:
-            # Parse dir output format
-            # Format: "MM/DD/YYYY  HH:MMAM  <DIR>  foldername"
-            # or "MM/DD/YYYY  HH:MMAM     12345 filename"
-            if "<DIR>" in line:
-                match = re.match(r".*<DIR>\s+(.+)", line)
-                if match:
+        try:
+            with os.scandir(path) as entries:
+                items = []
+                for entry in entries:
+                    if not show_hidden and _is_hidden(entry):
+                        continue
+                    is_dir = entry.is_dir(follow_symlinks=False)
                     items.append({
-                        "name": match.group(1).strip(),
-                        "is_dir": True,
-                        "size": 0,
+                        "name": entry.name,
+                        "is_dir": is_dir,
+                        "size": 0 if is_dir else entry.stat(follow_symlinks=False).st_size,
                     })
-            else:
-                parts = line.split()
-                if len(parts) >= 4:
-                    try:
-                        size = int(parts[-2]) if parts[-2].isdigit() else 0
-                        items.append({
-                            "name": parts[-1],
-                            "is_dir": False,
-                            "size": size,
-                        })
-                    except (ValueError, IndexError):
-                        pass
+        except OSError:
+            return []
 
         return items
 
-    def create_directory(self, path: str) -> bool:
+    def create_directory(self, path: str, use_shell: bool = False) -> bool:
         """
         Create a directory.
 
         Args:
             path: Directory path to create.
+            use_shell: Run ``md`` in cmd.exe instead of calling the OS directly.
 
         Returns:
             True if successful.
         """
-        command = f'md "{path}"'
-        return self.execute(command)["success"]
+        if use_shell:
+            return self.execute(_join("md", _quote(path)))["success"]
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            return False
+        return True
 
-    def delete_file(self, path: str, force: bool = False) -> bool:
+    def delete_file(
+        self,
+        path: str,
+        force: bool = False,
+        use_shell: bool = False,
+    ) -> bool:
         """
         Delete a file.
 
         Args:
             path: File path.
             force: Delete read-only files.
+            use_shell: Run ``del`` in cmd.exe instead of calling the OS directly.
 
         Returns:
             True if successful.
         """
-        flag = "/F " if force else ""
-        command = f'del {flag}"{path}"'
-        return self.execute(command)["success"]
+        if use_shell:
+            flag = "/F" if force else ""
+            return self.execute(_join("del", flag, _quote(path)))["success"]
+        try:
+            if force:
+                os.chmod(path, stat.S_IWRITE)
+            os.remove(path)
+        except OSError:
+            return False
+        return True
 
-    def delete_directory(self, path: str, recursive: bool = False) -> bool:
+    def delete_directory(
+        self,
+        path: str,
+        recursive: bool = False,
+        use_shell: bool = False,
+    ) -> bool:
         """
         Delete a directory.
 
         Args:
             path: Directory path.
             recursive: Delete contents recursively.
+            use_shell: Run ``rmdir`` in cmd.exe instead of calling the OS directly.
 
         Returns:
             True if successful.
         """
-        flag = "/S /Q " if recursive else ""
-        command = f'rmdir {flag}"{path}"'
-        return self.execute(command)["success"]
+        if use_shell:
+            flag = "/S /Q" if recursive else ""
+            return self.execute(_join("rmdir", flag, _quote(path)))["success"]
+        try:
+            if recursive:
+                shutil.rmtree(path)
+            else:
+                os.rmdir(path)
+        except OSError:
+            return False
+        return True
 
     def copy_file(
         self,
         source: str,
         destination: str,
         overwrite: bool = False,
+        use_shell: bool = False,
     ) -> bool:
         """
         Copy a file.
@@ -521,18 +916,31 @@ class CMDAdapter(BaseAdapter):
             source: Source path.
             destination: Destination path.
             overwrite: Overwrite existing file.
+            use_shell: Run ``copy`` in cmd.exe instead of calling the OS directly.
 
         Returns:
             True if successful.
         """
-        flag = "/Y " if overwrite else ""
-        command = f'copy {flag}"{source}" "{destination}"'
-        return self.execute(command)["success"]
+        if use_shell:
+            flag = "/Y" if overwrite else ""
+            command = _join("copy", flag, _quote(source), _quote(destination))
+            return self.execute(command)["success"]
+        target = destination
+        if os.path.isdir(destination):
+            target = os.path.join(destination, os.path.basename(source))
+        if not overwrite and os.path.exists(target):
+            return False
+        try:
+            shutil.copy2(source, target)
+        except OSError:
+            return False
+        return True
 
     def move_file(
         self,
         source: str,
         destination: str,
+        use_shell: bool = False,
     ) -> bool:
         """
         Move/rename a file.
@@ -540,17 +948,29 @@ class CMDAdapter(BaseAdapter):
         Args:
             source: Source path.
             destination: Destination path.
+            use_shell: Run ``move`` in cmd.exe instead of calling the OS directly.
 
         Returns:
             True if successful.
         """
-        command = f'move /Y "{source}" "{destination}"'
-        return self.execute(command)["success"]
+        if use_shell:
+            command = _join("move", "/Y", _quote(source), _quote(destination))
+            return self.execute(command)["success"]
+        try:
+            if os.path.isfile(destination):
+                # Match `move /Y`, which replaces an existing file
+                os.replace(source, destination)
+            else:
+                shutil.move(source, destination)
+        except OSError:
+            return False
+        return True
 
     def rename(
         self,
         path: str,
         new_name: str,
+        use_shell: bool = False,
     ) -> bool:
         """
         Rename a file or directory.
@@ -558,13 +978,20 @@ class CMDAdapter(BaseAdapter):
         Args:
             path: Current path.
             new_name: New name.
+            use_shell: Run ``ren`` in cmd.exe instead of calling the OS directly.
 
         Returns:
             True if successful.
         """
         directory = str(Path(path).parent)
-        command = f'ren "{path}" "{new_name}"'
-        return self.execute(command, cwd=directory)["success"]
+        if use_shell:
+            command = _join("ren", _quote(path), _quote(new_name))
+            return self.execute(command, cwd=directory)["success"]
+        try:
+            os.rename(path, os.path.join(directory, new_name))
+        except OSError:
+            return False
+        return True
 
     def run_command_prompt(
         self,
@@ -5,14 +5,88 @@ Provides integration with PowerShell (both Windows PowerShell and PowerShell Cor
 """
 
 from __future__ import annotations
+import asyncio
+import json
 import subprocess
 import os
-from typing import Optional, Dict, Any, List
+import queue
+import shutil
+import threading
+import time
+import uuid
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+import psutil
+
 from .base import BaseAdapter, AdapterInfo, ShellType
 
 
+def _pwsh_argv(
+    executable: str,
+    command: Optional[str] = None,
+    *,
+    interactive: bool = False,
+) -> List[str]:
+    """
+    Build the argv for a PowerShell launch.
+
+    Transient launches skip profile loading, which dominates PowerShell
+    startup time; interactive shells only suppress the banner.
+
+    Args:
+        executable: PowerShell executable.
+        command: Command to run with -Command.
+        interactive: Whether the process is a user-facing shell.
+
+    Returns:
+        Argument list for subprocess.
+    """
+    if interactive:
+        argv = [executable, "-NoLogo"]
+    else:
+        argv = [executable, "-NoLogo", "-NoProfile", "-NonInteractive"]
+    if command is not None:
+        argv += ["-Command", command]
+    return argv
+
+
+# Matches the typical pipe buffer size
+_PIPE_BUFSIZE = 64 * 1024
+
+
+def _decode(data: Optional[bytes]) -> str:
+    """Decode captured process output, normalizing line endings."""
+    if not data:
+        return ""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+def _kill_tree(pid: int) -> bool:
+    """Kill a process together with all of its descendants."""
+    try:
+        parent = psutil.Process(pid)
+        children = parent.children(recursive=True)
+    except psutil.Error:
+        return False
+    for process in [*children, parent]:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    return True
+
+
+def _escape_single(value: str) -> str:
+    """Escape a value for use inside a single-quoted PowerShell string."""
+    return value.replace("'", "''")
+
+
+def _pwsh_quote(value: str) -> str:
+    """Quote a value as a literal single-quoted PowerShell string."""
+    return "'" + _escape_single(value) + "'"
+
+
 class PowerShellAdapter(BaseAdapter):
     """
     Adapter for PowerShell.
@@ -21,6 +95,9 @@ class PowerShellAdapter(BaseAdapter):
     PowerShell Core (pwsh.exe).
     """
 
+    # Seconds a successful availability probe stays valid
+    AVAILABILITY_TTL = 60.0
+
     def __init__(
         self,
         shell_type: ShellType = ShellType.POWERSHELL_CORE,
@@ -36,8 +113,45 @@ class PowerShellAdapter(BaseAdapter):
             timeout: Default command timeout in seconds.
         """
         self._shell_type = shell_type
-        self._executable = executable or self._find_executable(shell_type)
+        name = executable or self._find_executable(shell_type)
+        # Resolved once; None means the executable is not installed
+        self._resolved_executable = shutil.which(name)
+        self._executable = self._resolved_executable or name
+        # Everything up to and including -Command; only the script varies
+        self._command_argv = (*_pwsh_argv(self._executable), "-Command")
         self._timeout = timeout
+        self._available: Optional[bool] = None
+        self._available_at: float = 0.0
+        self._version: Optional[str] = None
+        self._worker: Optional[subprocess.Popen] = None
+        self._worker_output: Optional[queue.Queue] = None
+        self._worker_errors: Optional[queue.Queue] = None
+        self._worker_lock = threading.Lock()
+        self._sessions: Dict[str, subprocess.Popen] = {}
+        self._base_env: Dict[str, str] = dict(os.environ)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def refresh_env(self) -> None:
+        """Re-snapshot os.environ after the caller has changed it."""
+        self._base_env = dict(os.environ)
+
+    def _build_env(self, env: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Merge overrides into the base environment; None means inherit."""
+        if not env:
+            return None
+        return {**self._base_env, **env}
+
+    @staticmethod
+    def _wrap(command: str) -> str:
+        """Wrap a command in a script block unless it is an expression."""
+        if command[:1] == "$":
+            return command
+        return f"& {{{command}}}"
 
     def _find_executable(self, shell_type: ShellType) -> str:
         """Find the PowerShell executable."""
@@ -59,26 +173,26 @@ class PowerShellAdapter(BaseAdapter):
         )
 
     def is_available(self) -> bool:
-        """Check if PowerShell is available."""
-        if not self._executable:
+        """Check if PowerShell is available (cached for AVAILABILITY_TTL)."""
+        if (
+            self._available is not None
+            and time.monotonic() - self._available_at < self.AVAILABILITY_TTL
+        ):
+            return self._available
+        self._available = self._probe()
+        self._available_at = time.monotonic()
+        return self._available
+
+    def _probe(self) -> bool:
+        """Run the PowerShell executable once to verify it is usable."""
+        if not self._resolved_executable:
             return False
 
         try:
-            # Check if executable exists
-            if self._executable.endswith(".exe"):
-                import ctypes
-                path = ctypes.windll.kernel32.GetFileAttributesW(self._executable)
-                if path == -1:
-                    return False
-            else:
-                if not Path(self._executable).exists():
-                    return False
-
             # Try running a simple command
             result = subprocess.run(
                 [self._executable, "-Version"],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
             return result.returncode == 0
@@ -86,16 +200,21 @@ class PowerShellAdapter(BaseAdapter):
             return False
 
     def _get_version(self) -> str:
-        """Get PowerShell version."""
+        """Get PowerShell version (queried once per adapter)."""
+        if self._version is None:
+            self._version = self._query_version()
+        return self._version
+
+    def _query_version(self) -> str:
+        """Ask the PowerShell executable for its version."""
         try:
             result = subprocess.run(
-                [self._executable, "-NoLogo", "-Command", "$PSVersionTable.PSVersion.ToString()"],
+                _pwsh_argv(self._executable, "$PSVersionTable.PSVersion.ToString()"),
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
             if result.returncode == 0:
-                return result.stdout.strip()
+                return _decode(result.stdout).strip()
         except Exception:
             pass
         return "unknown"
@@ -106,6 +225,8 @@ class PowerShellAdapter(BaseAdapter):
         cwd: Optional[str] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        capture: bool = True,
+        assume_available: bool = False,
     ) -> Dict[str, Any]:
         """
         Execute a PowerShell command.
@@ -115,11 +236,15 @@ class PowerShellAdapter(BaseAdapter):
             cwd: Working directory.
             env: Environment variables.
             timeout: Execution timeout.
+            capture: Collect stdout/stderr; when False the output is
+                discarded and returned as empty strings.
+            assume_available: Skip the availability check (for trusted
+                callers in tight loops).
 
         Returns:
             Response with stdout, stderr, and exit code.
         """
-        if not self.is_available():
+        if not assume_available and not self.is_available():
             return {
                 "success": False,
                 "stdout": "",
@@ -127,35 +252,44 @@ class PowerShellAdapter(BaseAdapter):
                 "exit_code": 1,
             }
 
+        # Build command
+        ps_command = self._wrap(command)
+
+        # The worker reads one statement per line and has a fixed
+        # environment and directory; anything else gets its own process.
+        if cwd is None and env is None and "\n" not in command:
+            result = self._run_in_worker(ps_command, timeout or self._timeout, capture)
+            if result is not None:
+                return result
+
         # Build environment
-        execution_env = os.environ.copy()
-        if env:
-            execution_env.update(env)
+        execution_env = self._build_env(env)
 
-        # Build command
-        ps_command = command if command.startswith("$") else f"& {{{command}}}"
+        if capture:
+            streams = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
+        else:
+            streams = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
 
         try:
-            result = subprocess.run(
-                [
-                    self._executable,
-                    "-NoLogo",
-                    "-NoProfile",
-                    "-Command",
-                    ps_command,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=timeout or self._timeout,
+            process = subprocess.Popen(
+                [*self._command_argv, ps_command],
                 cwd=cwd,
                 env=execution_env,
+                **streams,
             )
+            try:
+                stdout, stderr = process.communicate(timeout=timeout or self._timeout)
+            except subprocess.TimeoutExpired:
+                # subprocess only kills the direct child; take grandchildren too
+                _kill_tree(process.pid)
+                process.communicate()
+                raise
 
             return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "exit_code": result.returncode,
+                "success": process.returncode == 0,
+                "stdout": _decode(stdout),
+                "stderr": _decode(stderr),
+                "exit_code": process.returncode,
             }
         except subprocess.TimeoutExpired:
             return {
@@ -172,6 +306,221 @@ class PowerShellAdapter(BaseAdapter):
                 "exit_code": 1,
             }
 
+    async def execute_async(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        assume_available: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Execute a PowerShell command in its own process without blocking.
+
+        Several calls can be awaited together (e.g. with asyncio.gather)
+        to run commands concurrently. On timeout the whole process tree
+        is killed.
+
+        Args:
+            command: PowerShell command to execute.
+            cwd: Working directory.
+            env: Environment variables.
+            timeout: Execution timeout.
+            assume_available: Skip the availability check.
+
+        Returns:
+            Response with stdout, stderr, and exit code.
+        """
+        if not assume_available and not self.is_available():
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": "PowerShell not available",
+                "exit_code": 1,
+            }
+
+        ps_command = self._wrap(command)
+
+        execution_env = self._build_env(env)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._command_argv,
+                ps_command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=execution_env,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=timeout or self._timeout
+                )
+            except asyncio.TimeoutError:
+                _kill_tree(process.pid)
+                await process.wait()
+                return {
+                    "success": False,
+                    "stdout": "",
+                    "stderr": "Command timed out",
+                    "exit_code": -1,
+                }
+
+            return {
+                "success": process.returncode == 0,
+                "stdout": _decode(stdout),
+                "stderr": _decode(stderr),
+                "exit_code": process.returncode,
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": str(e),
+                "exit_code": 1,
+            }
+
+    def _ensure_worker(self) -> Optional[subprocess.Popen]:
+        """Start the long-lived PowerShell worker if it is not running."""
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+
+        try:
+            worker = subprocess.Popen(
+                _pwsh_argv(self._executable, "-"),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except Exception:
+            self._worker = None
+            return None
+
+        output: queue.Queue = queue.Queue()
+        errors: queue.Queue = queue.Queue()
+
+        def _reader(stream, lines: queue.Queue) -> None:
+            for line in stream:
+                lines.put(_decode(line))
+            lines.put(None)
+
+        for stream, lines in ((worker.stdout, output), (worker.stderr, errors)):
+            threading.Thread(target=_reader, args=(stream, lines), daemon=True).start()
+        self._worker = worker
+        self._worker_output = output
+        self._worker_errors = errors
+        return worker
+
+    def _run_in_worker(
+        self,
+        ps_command: str,
+        timeout: float,
+        capture: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute a command in the long-lived PowerShell worker.
+
+        The command is fed ``$null`` as pipeline input so that it cannot read
+        the following status line from the worker's stdin, and a sentinel is
+        written to both stdout and stderr so each stream is read to the end
+        of this command.
+
+        Returns:
+            Response dict, or None if the worker could not be started and the
+            caller should fall back to a one-shot process.
+        """
+        with self._worker_lock:
+            worker = self._ensure_worker()
+            if worker is None:
+                return None
+
+            sentinel = f"<<<EOF:{uuid.uuid4().hex}>>>"
+            status = (
+                "$__wt2_ec = if ($?) { 0 } elseif ($LASTEXITCODE) { $LASTEXITCODE } else { 1 }; "
+                f"[Console]::Error.WriteLine('{sentinel}'); "
+                f"[Console]::Out.WriteLine('{sentinel} ' + $__wt2_ec)"
+            )
+            try:
+                worker.stdin.write(f"$null | . {{ {ps_command} }}\n{status}\n".encode("utf-8"))
+                worker.stdin.flush()
+            except (OSError, ValueError):
+                self._close_worker()
+                return None
+
+            deadline = time.monotonic() + timeout
+            stdout, status, error = self._read_worker(self._worker_output, sentinel, deadline)
+            stderr: List[str] = []
+            if status is not None:
+                stderr, _, error = self._read_worker(self._worker_errors, sentinel, deadline)
+            if error:
+                # Timed out, or the worker exited mid-command; either way the
+                # command is not run again since it may have had side effects.
+                self._close_worker()
+                return {
+                    "success": False,
+                    "stdout": "".join(stdout),
+                    "stderr": "".join(stderr) + error,
+                    "exit_code": -1,
+                }
+
+            try:
+                exit_code = int(status.strip())
+            except ValueError:
+                exit_code = 1
+            return {
+                "success": exit_code == 0,
+                "stdout": "".join(stdout) if capture else "",
+                "stderr": "".join(stderr) if capture else "",
+                "exit_code": exit_code,
+            }
+
+    @staticmethod
+    def _read_worker(
+        lines: queue.Queue,
+        sentinel: str,
+        deadline: float,
+    ) -> Tuple[List[str], Optional[str], str]:
+        """
+        Read one worker stream up to ``sentinel``.
+
+        Args:
+            lines: Queue fed by the stream's reader thread.
+            sentinel: Marker written after the command.
+            deadline: ``time.monotonic()`` value by which the command must
+                have finished.
+
+        Returns:
+            The lines before the sentinel, the rest of the sentinel line (None
+            if it never arrived) and the reason it did not arrive.
+        """
+        collected: List[str] = []
+        while True:
+            try:
+                line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return collected, None, "Command timed out"
+            if line is None:
+                return collected, None, "PowerShell worker exited"
+            if line.startswith(sentinel):
+                return collected, line[len(sentinel):], ""
+            collected.append(line)
+
+    def _close_worker(self) -> None:
+        """Terminate the long-lived PowerShell worker."""
+        worker, self._worker = self._worker, None
+        self._worker_output = self._worker_errors = None
+        if worker is not None and worker.poll() is None:
+            try:
+                worker.kill()
+                worker.wait(timeout=2)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Release the persistent PowerShell worker."""
+        with self._worker_lock:
+            self._close_worker()
+
     def execute_script(
         self,
         script_path: str,
@@ -220,15 +569,12 @@ class PowerShellAdapter(BaseAdapter):
             env: Environment variables.
 
         Returns:
-            Session identifier (process ID).
+            Session identifier.
         """
-        import uuid
         session_id = str(uuid.uuid4())
 
         # Build environment
-        execution_env = os.environ.copy()
-        if env:
-            execution_env.update(env)
+        execution_env = self._build_env(env)
 
         # Start interactive process
         process = subprocess.Popen(
@@ -239,35 +585,33 @@ class PowerShellAdapter(BaseAdapter):
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            bufsize=_PIPE_BUFSIZE,
         )
 
-        return f"{session_id}:{process.pid}"
+        self._sessions[session_id] = process
+        return session_id
 
     def end_session(self, session_id: str) -> bool:
         """
         End a PowerShell session.
 
         Args:
-            session_id: Session identifier (format: "uuid:pid").
+            session_id: Session identifier returned by start_session.
 
         Returns:
             True if successful.
         """
-        try:
-            parts = session_id.split(":")
-            if len(parts) == 2:
-                pid = int(parts[1])
-                # Terminate the process
-                import ctypes
-                PROCESS_TERMINATE = 1
-                handle = ctypes.windll.kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
-                if handle:
-                    ctypes.windll.kernel32.TerminateProcess(handle, 0)
-                    ctypes.windll.kernel32.CloseHandle(handle)
-                    return True
+        process = self._sessions.pop(session_id, None)
+        if process is None:
             return False
-        except Exception:
+        # Only a live child's pid is known to still be ours
+        if process.poll() is None and not _kill_tree(process.pid):
             return False
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
 
     def send_input(
         self,
@@ -332,15 +676,25 @@ class PowerShellAdapter(BaseAdapter):
 
         Args:
             session_id: Session identifier.
-            *variables: Variables to retrieve.
+            *variables: Variables to retrieve (defaults to PATH).
 
         Returns:
-            Dictionary of variables.
+            Dictionary of variables that are set.
         """
-        result = self.execute("$env:Path")
-        if result["success"]:
-            return {"PATH": result["stdout"]}
-        return {}
+        names = "','".join(_escape_single(v) for v in (variables or ("PATH",)))
+        result = self.execute(
+            f"$h = @{{}}; foreach ($n in @('{names}')) "
+            "{ $h[$n] = [Environment]::GetEnvironmentVariable($n) }; "
+            "$h | ConvertTo-Json -Compress"
+        )
+        if not result["success"]:
+            return {}
+
+        try:
+            values = json.loads(result["stdout"])
+        except ValueError:
+            return {}
+        return {k: v for k, v in values.items() if v is not None}
 
     def set_environment(
         self,
@@ -357,11 +711,12 @@ class PowerShellAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        for key, value in variables.items():
-            command = f"$env:{key} = '{value}'"
-            if not self.execute(command)["success"]:
-                return False
-        return True
+        if not variables:
+            return True
+        command = "; ".join(
+            f"$env:{key} = '{_escape_single(value)}'" for key, value in variables.items()
+        )
+        return self.execute(command, capture=False)["success"]
 
     def get_working_directory(self, session_id: str) -> str:
         """
@@ -390,7 +745,7 @@ class PowerShellAdapter(BaseAdapter):
             True if successful.
         """
         command = f'Set-Location "{path}"'
-        return self.execute(command)["success"]
+        return self.execute(command, capture=False)["success"]
 
     def clear_screen(self, session_id: str) -> bool:
         """
@@ -402,7 +757,7 @@ class PowerShellAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        return self.execute("Clear-Host")["success"]
+        return self.execute("Clear-Host", capture=False)["success"]
 
     def get_exit_code(self, session_id: str) -> Optional[int]:
         """
@@ -437,17 +792,29 @@ class PowerShellAdapter(BaseAdapter):
 
     # Additional PowerShell-specific methods
 
-    def invoke_expression(self, expression: str) -> Dict[str, Any]:
+    def invoke_expression(
+        self,
+        expression: str,
+        structured: bool = False,
+    ) -> Dict[str, Any]:
         """
         Invoke a PowerShell expression.
 
         Args:
             expression: PowerShell expression to invoke.
+            structured: Serialize the result with ConvertTo-Json; pass True
+                when the caller needs to parse objects rather than text.
 
         Returns:
-            Response with result.
+            Response with result. Unstructured calls also carry the trimmed
+            output under "result".
         """
-        return self.execute(f"({expression}) | ConvertTo-Json -Depth 1")
+        if structured:
+            return self.execute(f"({expression}) | ConvertTo-Json -Depth 1")
+
+        result = self.execute(expression)
+        result["result"] = result.get("stdout", "").strip()
+        return result
 
     def invoke_command(
         self,
@@ -466,21 +833,27 @@ class PowerShellAdapter(BaseAdapter):
         Returns:
             Response with result.
         """
-        cmd_parts = [name]
+        cmd_parts = [
+            name,
+            *(_pwsh_quote(arg) for arg in args or ()),
+            *(
+                f"-{key} {_pwsh_quote(value) if isinstance(value, str) else value}"
+                for key, value in (parameters or {}).items()
+            ),
+        ]
+        return self.execute(" ".join(cmd_parts))
 
-        if args:
-            for arg in args:
-                cmd_parts.append(f'"{arg}"')
+    def invoke_commands_batch(self, commands: List[str]) -> Dict[str, Any]:
+        """
+        Invoke several PowerShell commands with a single execution.
 
-        if parameters:
-            for key, value in parameters.items():
-                if isinstance(value, str):
-                    cmd_parts.append(f"-{key} '{value}'")
-                else:
-                    cmd_parts.append(f"-{key} {value}")
+        Args:
+            commands: Commands to run in order.
 
-        command = " ".join(cmd_parts)
-        return self.execute(command)
+        Returns:
+            Combined response for the whole batch.
+        """
+        return self.execute("; ".join(commands))
 
     def get_module_version(self, module_name: str) -> Optional[str]:
         """
@@ -5,14 +5,20 @@ Provides integration with Windows Terminal via its JSON command API.
 """
 
 from __future__ import annotations
+import itertools
 import json
+import os
+import shutil
 import time
 from typing import Optional, Dict, Any, List
 import ctypes
 from ctypes import wintypes
 
 from .base import BaseAdapter, AdapterInfo, ShellType, AdapterRegistry
-from ..core.terminal import WindowsTerminalAPI
+from ..core.terminal import WindowsTerminalAPI, get_cli
+
+# Fallback tab ids when Windows Terminal does not report one
+_tab_counter = itertools.count(time.monotonic_ns())
 
 
 class TerminalAdapter(BaseAdapter):
@@ -23,6 +29,9 @@ class TerminalAdapter(BaseAdapter):
     to communicate with the terminal.
     """
 
+    # Seconds an availability probe result is reused
+    AVAILABILITY_TTL = 5.0
+
     def __init__(
         self,
         timeout: float = 5.0,
@@ -39,6 +48,7 @@ class TerminalAdapter(BaseAdapter):
         self._pipe_name = pipe_name
         self._api: Optional[WindowsTerminalAPI] = None
         self._connected = False
+        self._avail_cache: Optional[tuple] = None
 
     @property
     def info(self) -> AdapterInfo:
@@ -53,31 +63,45 @@ class TerminalAdapter(BaseAdapter):
 
     def is_available(self) -> bool:
         """Check if Windows Terminal is available."""
-        try:
-            # Try to connect
-            api = WindowsTerminalAPI(timeout=1.0)
-            api.connect()
-            api.disconnect()
+        if self._connected and self._api:
             return True
+
+        now = time.monotonic()
+        if self._avail_cache and now - self._avail_cache[0] < self.AVAILABILITY_TTL:
+            return self._avail_cache[1]
+
+        try:
+            # Same wt.exe the shared CLI instance will launch
+            wt_path = get_cli().wt_path
+            available = os.path.isfile(wt_path) or shutil.which(wt_path) is not None
         except Exception:
-            return False
+            available = False
+        self._avail_cache = (now, available)
+        return available
 
     def connect(self) -> bool:
-        """Establish connection to Windows Terminal."""
-        try:
-            self._api = WindowsTerminalAPI(timeout=self._timeout)
-            self._api.connect()
-            self._connected = True
+        """Attach to the process-wide Windows Terminal CLI instance."""
+        if self._connected and self._api:
             return True
+
+        try:
+            self._api = get_cli()
         except Exception:
             self._connected = False
             return False
+        self._connected = True
+        return True
+
+    def _ensure_connected(self) -> bool:
+        """Connect only if there is no live connection yet."""
+        if self._connected and self._api:
+            return True
+        return self.connect()
 
     def disconnect(self) -> None:
-        """Disconnect from Windows Terminal."""
-        if self._api:
-            self._api.disconnect()
-            self._connected = False
+        """Detach from the shared CLI instance, which stays alive for others."""
+        self._api = None
+        self._connected = False
 
     def execute(
         self,
@@ -100,8 +124,7 @@ class TerminalAdapter(BaseAdapter):
         Returns:
             Response with success status.
         """
-        if not self._connected:
-            self.connect()
+        self._ensure_connected()
 
         try:
             result = self._api.execute_command(
@@ -123,6 +146,35 @@ class TerminalAdapter(BaseAdapter):
                 "exit_code": 1,
             }
 
+    def execute_batch(self, commands: List[List[str]]) -> Dict[str, Any]:
+        """
+        Run several Windows Terminal subcommands in one round trip.
+
+        Args:
+            commands: Subcommand argument lists, e.g.
+                ``[["new-tab"], ["split-pane", "-V"]]``.
+
+        Returns:
+            Response with success status.
+        """
+        try:
+            # wt.exe needs no connection; go straight to the shared CLI
+            result = get_cli().run_batch(commands)
+            return {
+                "success": result.get("success", False),
+                "stdout": "",
+                "stderr": result.get("error") or "",
+                "exit_code": 0 if result.get("success") else 1,
+                "result": result,
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": str(e),
+                "exit_code": 1,
+            }
+
     def start_session(
         self,
         cwd: Optional[str] = None,
@@ -138,13 +190,12 @@ class TerminalAdapter(BaseAdapter):
         Returns:
             Session identifier (tab ID).
         """
-        if not self._connected:
-            self.connect()
+        self._ensure_connected()
 
         result = self._api.new_tab(
             cwd=cwd,
         )
-        tab_id = result.get("tabId", int(time.time()))
+        tab_id = result.get("tabId") or next(_tab_counter)
         return str(tab_id)
 
     def end_session(self, session_id: str) -> bool:
@@ -184,7 +235,7 @@ class TerminalAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        if not self._connected:
+        if not self._ensure_connected():
             return False
 
         try:
@@ -348,8 +399,7 @@ class TerminalAdapter(BaseAdapter):
         Returns:
             Response with window ID.
         """
-        if not self._connected:
-            self.connect()
+        self._ensure_connected()
 
         result = self._api.send_command("newWindow")
         return result
@@ -6,9 +6,16 @@ Includes path conversion utilities for Windows/WSL interoperability.
 """
 
 from __future__ import annotations
+import asyncio
+import functools
 import subprocess
 import os
+import queue
 import re
+import shlex
+import threading
+import time
+import uuid
 from typing import Optional, Dict, Any, List
 from pathlib import Path, PurePosixPath, PureWindowsPath
 
@@ -17,11 +24,71 @@ from ..utils.path import (
     windows_to_wsl,
     wsl_to_windows,
     detect_wsl_distro,
-    is_windows_path,
     is_wsl_path,
     get_wsl_home_distro,
 )
 
+# Path helpers are pure string functions; the same cwd and env values are
+# converted on every call, so memoize them at the adapter boundary.
+_windows_to_wsl = functools.lru_cache(maxsize=1024)(windows_to_wsl)
+_wsl_to_windows = functools.lru_cache(maxsize=1024)(wsl_to_windows)
+
+# Record separator written between batched command outputs and exit codes
+_RS = "\x1e"
+
+# "<source> on <mount point> type <fstype> (...)" lines from mount(8)
+_MOUNT_RE = re.compile(r"^(\S+) on (\S+) type (.*)$", re.MULTILINE)
+# Names that bash can expand indirectly with ${!name}
+_VAR_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _decode(data: bytes) -> str:
+    """Decode output captured from Linux programs, which write UTF-8."""
+    return data.decode("utf-8", "replace")
+
+
+def _decode_wsl_exe(data: bytes) -> str:
+    """
+    Decode wsl.exe's own output (``--list``, ``--version``).
+
+    Those messages are UTF-16LE on most Windows builds but plain UTF-8 on
+    some, so pick the codec from the bytes.
+    """
+    if b"\x00" in data:
+        return data.decode("utf-16-le", "replace").lstrip("\ufeff")
+    return data.decode("utf-8", "replace")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write bytes straight to a pipe descriptor, bypassing Python buffering."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _not_available() -> Dict[str, Any]:
+    """Response used when wsl.exe cannot be launched."""
+    return {
+        "success": False,
+        "stdout": "",
+        "stderr": "WSL not available",
+        "exit_code": 1,
+    }
+
+
+async def _none() -> None:
+    """Placeholder awaitable for probes that are already cached."""
+    return None
+
+
+def _parse_env(text: str) -> Dict[str, str]:
+    """Parse ``printenv`` output into a dictionary; values are kept verbatim."""
+    return {
+        key: value
+        for key, sep, value in (line.partition("=") for line in text.splitlines())
+        if sep
+    }
+
 
 class WSLAdapter(BaseAdapter):
     """
@@ -31,6 +98,9 @@ class WSLAdapter(BaseAdapter):
     manage sessions, and convert paths between Windows and WSL formats.
     """
 
+    # Seconds to trust a cached availability/distribution lookup
+    AVAILABILITY_TTL = 30.0
+
     def __init__(
         self,
         distribution: Optional[str] = None,
@@ -51,7 +121,58 @@ class WSLAdapter(BaseAdapter):
         self._executable = executable or "wsl.exe"
         self._timeout = timeout
         self._default_user = default_user
+        self._build_argv()
         self._detected_distro: Optional[str] = None
+        self._available: Optional[bool] = None
+        self._available_at: float = 0.0
+        self._version: Optional[str] = None
+        self._distributions: Optional[List[str]] = None
+        self._distributions_at: float = 0.0
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_output: Optional[queue.Queue] = None
+        self._shell_lock = threading.Lock()
+        self._base_env = dict(os.environ)
+        self._sessions: Dict[str, subprocess.Popen] = {}
+
+    def refresh_env(self) -> None:
+        """Re-snapshot os.environ after the caller has changed it."""
+        self._base_env = dict(os.environ)
+
+    def _build_env(self, env: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Overlay caller variables (Windows paths converted to WSL format)
+        on the base environment; None means inherit.
+        """
+        if not env:
+            return None
+        overrides = {
+            key: _windows_to_wsl(value)
+            for key, value in env.items()
+        }
+        return {**self._base_env, **overrides}
+
+    @property
+    def distribution(self) -> Optional[str]:
+        """Distribution commands run in (None for the WSL default)."""
+        return self._distribution
+
+    @distribution.setter
+    def distribution(self, value: Optional[str]) -> None:
+        self._distribution = value
+        self._build_argv()
+
+    def _build_argv(self) -> None:
+        """Precompute the wsl.exe argument prefixes used by every call."""
+        distro_args = ("--distribution", self._distribution) if self._distribution else ()
+        user_args = ("--user", self._default_user) if self._default_user else ()
+        self._distro_argv = (self._executable, *distro_args)
+        self._prefix_argv = (*self._distro_argv, *user_args)
+
+    def invalidate_cache(self) -> None:
+        """Forget cached availability and distribution lookups."""
+        self._available = None
+        self._distributions = None
+        self._detected_distro = None
 
     def _detect_default_distribution(self) -> str:
         """Detect the default WSL distribution."""
@@ -74,33 +195,99 @@ class WSLAdapter(BaseAdapter):
             default_args=["--distribution", distro] if distro else [],
         )
 
+    async def info_async(self) -> AdapterInfo:
+        """
+        Get adapter information, running the wsl.exe probes concurrently.
+
+        The distribution listing and version query are independent, so
+        both are launched at once and their results fill the caches used
+        by ``info``.
+
+        Returns:
+            Adapter information.
+        """
+        now = time.monotonic()
+        need_list = (
+            self._distributions is None
+            or now - self._distributions_at >= self.AVAILABILITY_TTL
+        )
+        need_version = self._version is None
+
+        listing, version = await asyncio.gather(
+            self._run_async("--list", "--quiet") if need_list else _none(),
+            self._run_async("--version") if need_version else _none(),
+        )
+
+        if need_list:
+            distros = [d.strip() for d in _decode_wsl_exe(listing or b"").split("\n") if d.strip()]
+            self._distributions = distros
+            self._distributions_at = self._available_at = time.monotonic()
+            self._available = bool(distros)
+            if distros and not self._detected_distro:
+                self._detected_distro = distros[0]
+        if need_version:
+            self._version = _decode_wsl_exe(version).strip() if version else "2.0"
+
+        return self.info
+
+    def prefetch_info(self) -> AdapterInfo:
+        """Synchronous wrapper around ``info_async`` for non-async callers."""
+        return asyncio.run(self.info_async())
+
+    async def _run_async(self, *args: str, timeout: float = 5) -> Optional[bytes]:
+        """
+        Run wsl.exe without blocking the event loop.
+
+        Returns:
+            Captured stdout if the command succeeded, otherwise None.
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self._executable,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return None
+        except Exception:
+            return None
+        return stdout if process.returncode == 0 else None
+
     def _get_wsl_version(self) -> str:
-        """Get WSL version information."""
+        """Get WSL version information (queried once per adapter)."""
+        if self._version is None:
+            self._version = self._query_wsl_version()
+        return self._version
+
+    def _query_wsl_version(self) -> str:
+        """Ask wsl.exe for its version."""
         try:
             result = subprocess.run(
                 [self._executable, "--version"],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
             if result.returncode == 0:
-                return result.stdout.strip()
+                return _decode_wsl_exe(result.stdout).strip()
         except Exception:
             pass
         return "2.0"
 
     def is_available(self) -> bool:
-        """Check if WSL is available."""
-        try:
-            result = subprocess.run(
-                [self._executable, "--list", "--quiet"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return result.returncode == 0 and bool(result.stdout.strip())
-        except Exception:
-            return False
+        """Check if WSL is available (cached for AVAILABILITY_TTL)."""
+        if (
+            self._available is not None
+            and time.monotonic() - self._available_at < self.AVAILABILITY_TTL
+        ):
+            return self._available
+        self._available = bool(self.get_distributions())
+        self._available_at = time.monotonic()
+        return self._available
 
     def get_distributions(self) -> List[str]:
         """
@@ -109,19 +296,27 @@ class WSLAdapter(BaseAdapter):
         Returns:
             List of distribution names.
         """
+        if (
+            self._distributions is not None
+            and time.monotonic() - self._distributions_at < self.AVAILABILITY_TTL
+        ):
+            return list(self._distributions)
+
+        distros: List[str] = []
         try:
             result = subprocess.run(
                 [self._executable, "--list", "--quiet"],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
             if result.returncode == 0:
-                distros = [d.strip() for d in result.stdout.split("\n") if d.strip()]
-                return distros
+                distros = [d.strip() for d in _decode_wsl_exe(result.stdout).split("\n") if d.strip()]
         except Exception:
             pass
-        return []
+
+        self._distributions = distros
+        self._distributions_at = time.monotonic()
+        return list(distros)
 
     def get_default_distribution(self) -> str:
         """
@@ -146,9 +341,9 @@ class WSLAdapter(BaseAdapter):
             result = subprocess.run(
                 [self._executable, "--setdefault", distribution],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
+            self._detected_distro = None
             return result.returncode == 0
         except Exception:
             return False
@@ -172,55 +367,45 @@ class WSLAdapter(BaseAdapter):
         Returns:
             Response with stdout, stderr, and exit code.
         """
-        if not self.is_available():
-            return {
-                "success": False,
-                "stdout": "",
-                "stderr": "WSL not available",
-                "exit_code": 1,
-            }
+        # The persistent shell has a fixed environment and directory, so
+        # calls that override either still get a dedicated wsl.exe.
+        if cwd is None and env is None:
+            result = self._execute_persistent(command, timeout or self._timeout)
+            if result is not None:
+                return result
 
-        # Convert Windows paths in environment to WSL format
-        wsl_env = os.environ.copy()
-        if env:
-            for key, value in env.items():
-                if is_windows_path(value):
-                    wsl_env[key] = windows_to_wsl(value)
-                else:
-                    wsl_env[key] = value
+        return self._execute_once(command, cwd, env, timeout)
 
-        # Build the WSL command
-        distro_args = ["--distribution", self._distribution] if self._distribution else []
-        user_args = ["--user", self._default_user] if self._default_user else []
+    def _execute_once(
+        self,
+        command: str,
+        cwd: Optional[str],
+        env: Optional[Dict[str, str]],
+        timeout: Optional[float],
+    ) -> Dict[str, Any]:
+        """Run a command in a dedicated ``wsl.exe bash -c`` process."""
+        wsl_env = self._build_env(env)
 
         # Convert working directory if it's a Windows path
-        wsl_cwd = None
-        if cwd:
-            if is_windows_path(cwd):
-                wsl_cwd = windows_to_wsl(cwd)
-            else:
-                wsl_cwd = cwd
+        wsl_cwd = _windows_to_wsl(cwd) if cwd else None
 
-        # Build full command
-        full_command = command
-        if wsl_cwd:
-            full_command = f"cd '{wsl_cwd}' && {command}"
+        # wsl.exe sets the directory itself; no shell-level cd needed
+        cd_args = ["--cd", wsl_cwd] if wsl_cwd else []
 
-        cmd = [self._executable] + distro_args + user_args + ["bash", "-c", full_command]
+        cmd = [*self._prefix_argv, *cd_args, "bash", "-c", command]
 
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=timeout or self._timeout,
                 env=wsl_env,
             )
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": _decode(result.stdout),
+                "stderr": _decode(result.stderr),
                 "exit_code": result.returncode,
             }
         except subprocess.TimeoutExpired:
@@ -230,6 +415,8 @@ class WSLAdapter(BaseAdapter):
                 "stderr": "Command timed out",
                 "exit_code": -1,
             }
+        except FileNotFoundError:
+            return _not_available()
         except Exception as e:
             return {
                 "success": False,
@@ -238,6 +425,118 @@ class WSLAdapter(BaseAdapter):
                 "exit_code": 1,
             }
 
+    def _ensure_shell(self) -> Optional[subprocess.Popen]:
+        """Start the long-lived ``wsl.exe bash`` process if it is not running."""
+        if self._shell is not None and self._shell.poll() is None:
+            return self._shell
+
+        try:
+            proc = subprocess.Popen(
+                [*self._prefix_argv, "bash", "--noprofile", "--norc"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except Exception:
+            self._shell = None
+            return None
+
+        output: queue.Queue = queue.Queue()
+
+        def _reader() -> None:
+            for line in proc.stdout:
+                output.put(line.decode("utf-8", "replace"))
+            output.put(None)
+
+        threading.Thread(target=_reader, daemon=True).start()
+        self._shell = proc
+        self._shell_output = output
+        return proc
+
+    def _execute_persistent(
+        self,
+        command: str,
+        timeout: float,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute a command in the long-lived bash process.
+
+        The command is followed by a unique sentinel line carrying ``$?``.
+        Stderr is merged into stdout, and stdin comes from ``/dev/null`` so
+        that the command cannot read the sentinel line itself.
+
+        Returns:
+            Response dict, or None if the persistent shell could not be
+            started and the caller should fall back to a one-shot process.
+        """
+        with self._shell_lock:
+            proc = self._ensure_shell()
+            if proc is None:
+                return None
+
+            sentinel = f"__WT2_END_{uuid.uuid4().hex}__"
+            try:
+                _write_all(
+                    proc.stdin.fileno(),
+                    f"{{ {command}\n}} </dev/null\nprintf '\\n{sentinel}%d\\n' $?\n".encode("utf-8"),
+                )
+            except (OSError, ValueError):
+                self._close_shell()
+                return None
+
+            deadline = time.monotonic() + timeout
+            lines: List[str] = []
+            while True:
+                try:
+                    line = self._shell_output.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self._close_shell()
+                    return {
+                        "success": False,
+                        "stdout": "".join(lines),
+                        "stderr": "Command timed out",
+                        "exit_code": -1,
+                    }
+                if line is None:
+                    # Shell exited (e.g. the command was ``exit``); the
+                    # command may have had side effects, so it is not re-run.
+                    self._close_shell()
+                    return {
+                        "success": False,
+                        "stdout": "".join(lines),
+                        "stderr": "Shell exited before the command finished",
+                        "exit_code": -1,
+                    }
+                if line.startswith(sentinel):
+                    try:
+                        exit_code = int(line[len(sentinel):].strip())
+                    except ValueError:
+                        exit_code = 1
+                    # Drop the newline the sentinel printf put before itself
+                    stdout = "".join(lines)[:-1]
+                    return {
+                        "success": exit_code == 0,
+                        "stdout": stdout,
+                        "stderr": "",
+                        "exit_code": exit_code,
+                    }
+                lines.append(line)
+
+    def _close_shell(self) -> None:
+        """Terminate the long-lived bash process."""
+        proc, self._shell, self._shell_output = self._shell, None, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+                proc.wait(timeout=2)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Release the persistent bash process."""
+        with self._shell_lock:
+            self._close_shell()
+
     def execute_powershell(self, command: str) -> Dict[str, Any]:
         """
         Execute a PowerShell command from within WSL.
@@ -250,32 +549,23 @@ class WSLAdapter(BaseAdapter):
         Returns:
             Response with stdout, stderr, and exit code.
         """
-        if not self.is_available():
-            return {
-                "success": False,
-                "stdout": "",
-                "stderr": "WSL not available",
-                "exit_code": 1,
-            }
-
         try:
             # Use wsl.exe to execute PowerShell on Windows
-            full_command = f"powershell.exe -NoProfile -Command \"{command}\""
-            distro_args = ["--distribution", self._distribution] if self._distribution else []
-
+            full_command = f"powershell.exe -NoLogo -NoProfile -NonInteractive -Command \"{command}\""
             result = subprocess.run(
-                [self._executable] + distro_args + ["bash", "-c", full_command],
+                [*self._distro_argv, "bash", "-c", full_command],
                 capture_output=True,
-                text=True,
                 timeout=self._timeout,
             )
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": _decode(result.stdout),
+                "stderr": _decode(result.stderr),
                 "exit_code": result.returncode,
             }
+        except FileNotFoundError:
+            return _not_available()
         except Exception as e:
             return {
                 "success": False,
@@ -299,32 +589,15 @@ class WSLAdapter(BaseAdapter):
         Returns:
             Session identifier.
         """
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         # Convert paths
-        wsl_cwd = None
-        if cwd:
-            if is_windows_path(cwd):
-                wsl_cwd = windows_to_wsl(cwd)
-            else:
-                wsl_cwd = cwd
-
-        # Build environment
-        wsl_env = os.environ.copy()
-        if env:
-            for key, value in env.items():
-                if is_windows_path(value):
-                    wsl_env[key] = windows_to_wsl(value)
-                else:
-                    wsl_env[key] = value
+        wsl_cwd = _windows_to_wsl(cwd) if cwd else None
 
-        # Start interactive process
-        distro_args = ["--distribution", self._distribution] if self._distribution else []
-        user_args = ["--user", self._default_user] if self._default_user else []
+        wsl_env = self._build_env(env)
 
-        cmd = [self._executable] + distro_args + user_args
+        # Start interactive process
+        cmd = list(self._prefix_argv)
 
         if wsl_cwd:
             cmd.extend(["--cd", wsl_cwd])
@@ -335,34 +608,33 @@ class WSLAdapter(BaseAdapter):
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
         )
 
-        return f"{session_id}:{process.pid}"
+        session_id = f"{session_id}:{process.pid}"
+        self._sessions[session_id] = process
+        return session_id
 
     def end_session(self, session_id: str) -> bool:
         """
         End a WSL session.
 
         Args:
-            session_id: Session identifier (format: "uuid:pid").
+            session_id: Session identifier.
 
         Returns:
             True if successful.
         """
-        try:
-            parts = session_id.split(":")
-            if len(parts) == 2:
-                pid = int(parts[1])
-                # Terminate the process
-                import ctypes
-                PROCESS_TERMINATE = 1
-                handle = ctypes.windll.kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
-                if handle:
-                    ctypes.windll.kernel32.TerminateProcess(handle, 0)
-                    ctypes.windll.kernel32.CloseHandle(handle)
-                    return True
+        process = self._sessions.pop(session_id, None)
+        if process is None:
             return False
+        try:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait(timeout=2)
+            return True
         except Exception:
             return False
 
@@ -383,7 +655,14 @@ class WSLAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        return True
+        process = self._sessions.get(session_id)
+        if process is None or process.poll() is not None:
+            return False
+        try:
+            _write_all(process.stdin.fileno(), text.encode("utf-8"))
+            return True
+        except (OSError, ValueError):
+            return False
 
     def get_prompt(self, session_id: str) -> str:
         """
@@ -428,20 +707,34 @@ class WSLAdapter(BaseAdapter):
 
         Args:
             session_id: Session identifier.
-            *variables: Variables to retrieve.
+            *variables: Variables to retrieve (all when omitted).
 
         Returns:
-            Dictionary of variables (values in WSL format).
+            Dictionary of variables that are set (values in WSL format).
         """
-        result = self.execute("printenv")
-        if result["success"]:
-            env = {}
-            for line in result["stdout"].split("\n"):
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    env[key.strip()] = value.strip()
-            return env
-        return {}
+        if not variables:
+            result = self.execute("printenv")
+            if result["success"]:
+                return _parse_env(result["stdout"])
+            return {}
+
+        # Only print the requested names, NUL-terminated so values may
+        # contain newlines.
+        names = " ".join(v for v in variables if _VAR_NAME_RE.match(v))
+        if not names:
+            return {}
+        result = self.execute(
+            f"for n in {names}; do "
+            '[ -n "${!n+x}" ] && printf \'%s=%s\\0\' "$n" "${!n}"; '
+            "done; :"
+        )
+        if not result["success"]:
+            return {}
+        return {
+            key: value
+            for key, sep, value in (item.partition("=") for item in result["stdout"].split("\0"))
+            if sep
+        }
 
     def set_environment(
         self,
@@ -458,11 +751,12 @@ class WSLAdapter(BaseAdapter):
         Returns:
             True if successful.
         """
-        for key, value in variables.items():
-            command = f'export {key}="{value}"'
-            if not self.execute(command)["success"]:
-                return False
-        return True
+        if not variables:
+            return True
+        assignments = " ".join(
+            f"{key}={shlex.quote(value)}" for key, value in variables.items()
+        )
+        return self.execute(f"export {assignments}")["success"]
 
     def get_working_directory(self, session_id: str) -> str:
         """
@@ -491,10 +785,9 @@ class WSLAdapter(BaseAdapter):
             True if successful.
         """
         # Convert Windows paths to WSL format
-        if is_windows_path(path):
-            path = windows_to_wsl(path)
+        path = _windows_to_wsl(path)
 
-        command = f'cd "{path}"'
+        command = f"cd {shlex.quote(path)}"
         return self.execute(command)["success"]
 
     def clear_screen(self, session_id: str) -> bool:
@@ -540,6 +833,78 @@ class WSLAdapter(BaseAdapter):
         """
         return self.end_session(session_id)
 
+    def snapshot(self, session_id: str) -> Dict[str, Any]:
+        """
+        Collect working directory, exit code, prompt and environment at once.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            Dictionary with "cwd", "exit_code", "prompt" and "environment".
+        """
+        exit_code, cwd, prompt, env = self._exec_batch(
+            ["echo $?", "pwd", "echo $PS1", "printenv"]
+        ) or [{}] * 4
+
+        try:
+            last_exit: Optional[int] = int(exit_code["stdout"].strip())
+        except (KeyError, ValueError):
+            last_exit = None
+
+        environment = _parse_env(env.get("stdout", ""))
+
+        return {
+            "cwd": cwd.get("stdout", "").strip(),
+            "exit_code": last_exit,
+            "prompt": prompt.get("stdout", "").strip() or "wsl$ ",
+            "environment": environment,
+        }
+
+    def _exec_batch(
+        self,
+        commands: List[str],
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several commands in one wsl.exe invocation.
+
+        Each command's output is followed by its exit code, both delimited
+        by a record separator, so the combined stdout can be split back
+        into per-command results.
+
+        Args:
+            commands: Commands to run in order.
+            timeout: Timeout for the whole batch.
+
+        Returns:
+            One response per command, or an empty list if the batch failed
+            to run. Stderr is not split per command.
+        """
+        if not commands:
+            return []
+
+        script = "".join(f"{command}\nprintf '\\036%d\\036' $?\n" for command in commands)
+        result = self.execute(script, timeout=timeout)
+        parts = result["stdout"].split(_RS)
+        if len(parts) < 2 * len(commands):
+            return []
+
+        results = []
+        for index in range(len(commands)):
+            stdout, code = parts[2 * index], parts[2 * index + 1]
+            try:
+                exit_code = int(code)
+            except ValueError:
+                exit_code = -1
+            results.append({
+                "success": exit_code == 0,
+                "stdout": stdout,
+                "stderr": "",
+                "exit_code": exit_code,
+            })
+        return results
+
     # WSL-specific methods
 
     def mount_windows_paths(self) -> Dict[str, str]:
@@ -549,17 +914,14 @@ class WSLAdapter(BaseAdapter):
         Returns:
             Dictionary mapping WSL paths to Windows UNC paths.
         """
-        result = self.execute("mount | grep -E '^//|wsl$'")
+        result = self.execute("mount")
         mounts = {}
 
         if result["success"]:
-            for line in result["stdout"].split("\n"):
-                if "on /" in line and "type" in line:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        source = parts[0]
-                        mount_point = parts[2]
-                        mounts[mount_point] = source
+            # Network shares and WSL-provided mounts only
+            for source, mount_point, rest in _MOUNT_RE.findall(result["stdout"]):
+                if source.startswith("//") or rest.rstrip().endswith("wsl"):
+                    mounts[mount_point] = source
 
         return mounts
 
@@ -590,7 +952,7 @@ class WSLAdapter(BaseAdapter):
         Returns:
             WSL path.
         """
-        return windows_to_wsl(windows_path)
+        return _windows_to_wsl(windows_path)
 
     def convert_path_to_windows(self, wsl_path: str) -> str:
         """
@@ -602,7 +964,7 @@ class WSLAdapter(BaseAdapter):
         Returns:
             Windows path.
         """
-        return wsl_to_windows(wsl_path)
+        return _wsl_to_windows(wsl_path)
 
     def run_windows_command(
         self,
@@ -619,39 +981,29 @@ class WSLAdapter(BaseAdapter):
         Returns:
             Response with stdout, stderr, and exit code.
         """
-        if not self.is_available():
-            return {
-                "success": False,
-                "stdout": "",
-                "stderr": "WSL not available",
-                "exit_code": 1,
-            }
-
-        # Build command to execute via wsl.exe
-        distro_args = ["--distribution", self._distribution] if self._distribution else []
-
         if cwd:
-            wsl_cwd = windows_to_wsl(cwd) if is_windows_path(cwd) else cwd
-            full_command = f"cd '{wsl_cwd}' && {command}"
+            wsl_cwd = _windows_to_wsl(cwd)
+            cd_args = ["--cd", wsl_cwd]
         else:
-            full_command = command
+            cd_args = []
 
-        cmd = [self._executable] + distro_args + ["bash", "-c", full_command]
+        cmd = [*self._distro_argv, *cd_args, "bash", "-c", command]
 
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=self._timeout,
             )
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": _decode(result.stdout),
+                "stderr": _decode(result.stderr),
                 "exit_code": result.returncode,
             }
+        except FileNotFoundError:
+            return _not_available()
         except Exception as e:
             return {
                 "success": False,
@@ -673,9 +1025,9 @@ class WSLAdapter(BaseAdapter):
             result = subprocess.run(
                 [self._executable, "--shutdown"],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
+            self.invalidate_cache()
             return result.returncode == 0
         except Exception:
             return False
@@ -698,9 +1050,9 @@ class WSLAdapter(BaseAdapter):
             result = subprocess.run(
                 [self._executable, "--terminate", distro],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
+            self.invalidate_cache()
             return result.returncode == 0
         except Exception:
             return False
@@ -732,9 +1084,9 @@ class WSLAdapter(BaseAdapter):
                     root_fs_path,
                 ],
                 capture_output=True,
-                text=True,
                 timeout=120,
             )
+            self.invalidate_cache()
             return result.returncode == 0
         except Exception:
             return False
@@ -758,7 +1110,6 @@ class WSLAdapter(BaseAdapter):
             result = subprocess.run(
                 [self._executable, "--export", distribution, file_path],
                 capture_output=True,
-                text=True,
                 timeout=300,
             )
             return result.returncode == 0
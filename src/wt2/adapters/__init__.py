@@ -1,7 +1,28 @@
 """Terminal adapter modules."""
 
+import importlib
+from typing import Any
+
 from wt2.adapters.terminal_adapter import TerminalAdapter
-from wt2.adapters.powershell_adapter import PowerShellAdapter
-from wt2.adapters.wsl_adapter import WSLAdapter
+
+# Concrete adapters are imported on first use, matching wt2.adapter, so
+# importing this package does not also load every shell implementation.
+_LAZY_ADAPTERS = {
+    "PowerShellAdapter": "wt2.adapters.powershell_adapter",
+    "WSLAdapter": "wt2.adapters.wsl_adapter",
+}
 
 __all__ = ["TerminalAdapter", "PowerShellAdapter", "WSLAdapter"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
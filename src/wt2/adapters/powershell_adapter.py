@@ -1,8 +1,19 @@
 """PowerShell adapter."""
 
 import base64
-from typing import Dict, Any
+import re
+from codecs import utf_16_le_encode
+from typing import ClassVar, Dict, Any
 from wt2.adapters.terminal_adapter import TerminalAdapter
+from wt2.core.connection import SharedConnection, TerminalConnection
+
+_b64encode = base64.b64encode
+_ENCODED_PREFIX = "powershell -NoLogo -NoProfile -NonInteractive -EncodedCommand "
+_PLAIN_PREFIX = "powershell -NoLogo -NoProfile -NonInteractive -Command "
+
+# Commands made only of these characters need no quoting or encoding
+_SAFE_RE = re.compile(r"[\w \-./:=]+", re.ASCII)
+_SAFE_MAX_LEN = 8000
 
 
 class PowerShellAdapter(TerminalAdapter):
@@ -10,6 +21,23 @@ class PowerShellAdapter(TerminalAdapter):
 
     name: str = "powershell"
 
+    # One connection shared by all instances, opened on first use
+    _conn: ClassVar[SharedConnection] = SharedConnection()
+
+    @classmethod
+    def _get_conn(cls) -> TerminalConnection:
+        """Return the shared connection, (re)connecting if it is closed.
+
+        Returns:
+            TerminalConnection: Open connection.
+        """
+        return cls._conn.get()
+
+    @classmethod
+    def close(cls) -> None:
+        """Release the shared connection."""
+        cls._conn.close()
+
     def execute_command(self, command: str) -> Dict[str, Any]:
         """Execute a command in PowerShell.
 
@@ -19,15 +47,15 @@ class PowerShellAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        from wt2.core.connection import TerminalConnection
-
-        conn = TerminalConnection()
-        conn.connect()
+        conn = self._get_conn()
 
-        encoded_command = self._encode_command(command)
+        if len(command) < _SAFE_MAX_LEN and _SAFE_RE.fullmatch(command):
+            payload = _PLAIN_PREFIX + command
+        else:
+            payload = self._encode_command(command)
         return conn.send_message({
             "action": "sendInput",
-            "input": encoded_command,
+            "input": payload,
         })
 
     def get_prompt(self) -> str:
@@ -36,10 +64,7 @@ class PowerShellAdapter(TerminalAdapter):
         Returns:
             str: The prompt.
         """
-        from wt2.core.connection import TerminalConnection
-
-        conn = TerminalConnection()
-        conn.connect()
+        conn = self._get_conn()
 
         result = conn.send_message({"action": "getPrompt"})
         return result.get("prompt", "PS > ")
@@ -64,8 +89,8 @@ class PowerShellAdapter(TerminalAdapter):
         Returns:
             str: Encoded command.
         """
-        encoded = base64.b64encode(command.encode("utf-16-le")).decode("ascii")
-        return f"powershell -EncodedCommand {encoded}"
+        encoded = _b64encode(utf_16_le_encode(command)[0]).decode("ascii")
+        return _ENCODED_PREFIX + encoded
 
     def get_version(self) -> str:
         """Get PowerShell version.
@@ -73,10 +98,7 @@ class PowerShellAdapter(TerminalAdapter):
         Returns:
             str: PowerShell version.
         """
-        from wt2.core.connection import TerminalConnection
-
-        conn = TerminalConnection()
-        conn.connect()
+        conn = self._get_conn()
 
         result = conn.send_message({"action": "getVersion"})
         return result.get("version", "unknown")
@@ -148,5 +170,7 @@ class PowerShellAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        full_command = "; ".join(commands)
+        # One script block, one command per line, so PowerShell tokenizes
+        # each command on its own instead of one long "; "-joined line
+        full_command = "& {\n" + "\n".join(commands) + "\n}"
         return self.execute_command(full_command)
@@ -1,8 +1,23 @@
-"""WSL adapter."""
+"""WSL adapter.
 
+Talks to WSL through the Windows Terminal connection. The subprocess-based
+adapter registered for ShellType.WSL lives in wt2.adapter.wsl.
+"""
+
+import re
 import subprocess
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 from wt2.adapters.terminal_adapter import TerminalAdapter
+from wt2.core.connection import SharedConnection
+
+# One connection shared by all WSLAdapter calls, opened on first use
+_shared_conn = SharedConnection()
+_get_conn = _shared_conn.get
+_close_conn = _shared_conn.close
+
+# "C:\\rest" / "C:/rest" / "C:rest" -> drive letter and remainder
+_WIN_DRIVE = re.compile(r"^([A-Za-z]):[\\/]?(.*)$", re.DOTALL)
+_BS_TABLE = str.maketrans("\\", "/")
 
 
 class WSLAdapter(TerminalAdapter):
@@ -19,10 +34,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        from wt2.core.connection import TerminalConnection
-
-        conn = TerminalConnection()
-        conn.connect()
+        conn = _get_conn()
 
         return conn.send_message({
             "action": "sendInput",
@@ -35,10 +47,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             str: The prompt.
         """
-        from wt2.core.connection import TerminalConnection
-
-        conn = TerminalConnection()
-        conn.connect()
+        conn = _get_conn()
 
         result = conn.send_message({"action": "getPrompt"})
         return result.get("prompt", "$ ")
@@ -70,10 +79,9 @@ class WSLAdapter(TerminalAdapter):
             return path
 
         # Convert drive letter
-        if len(path) >= 2 and path[1] == ":":
-            drive = path[0].lower()
-            rest = path[2:].replace("\\", "/")
-            return f"/mnt/{drive}/{rest}"
+        match = _WIN_DRIVE.match(path)
+        if match:
+            return f"/mnt/{match.group(1).lower()}/{match.group(2).translate(_BS_TABLE)}"
 
         return path
 
@@ -88,16 +96,31 @@ class WSLAdapter(TerminalAdapter):
         """
         return self.execute_command(f"wsl.exe {command}")
 
+    def _send_wsl_argv(self, *args: str) -> Dict[str, Any]:
+        """Send a wsl.exe invocation built from an argument vector.
+
+        Goes straight to the shared connection instead of wrapping the
+        command in another `wsl` layer; arguments are quoted once with
+        Windows command-line rules.
+
+        Args:
+            *args: Arguments for wsl.exe.
+
+        Returns:
+            dict: Result of the operation.
+        """
+        return _get_conn().send_message({
+            "action": "sendInput",
+            "input": "wsl.exe " + subprocess.list2cmdline(args),
+        })
+
     def list_distributions(self) -> Dict[str, Any]:
         """List available WSL distributions.
 
         Returns:
             dict: List of distributions.
         """
-        from wt2.core.connection import TerminalConnection
-
-        conn = TerminalConnection()
-        conn.connect()
+        conn = _get_conn()
 
         return conn.send_message({"action": "listDistros"})
 
@@ -110,7 +133,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        return self.execute_command(f"wsl.exe --setdefault {distro_name}")
+        return self._send_wsl_argv("--setdefault", distro_name)
 
     def run_as_user(self, username: str, command: str) -> Dict[str, Any]:
         """Run a command as a specific user.
@@ -122,7 +145,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        return self.execute_command(f"wsl.exe --user {username} {command}")
+        return self._send_wsl_argv("--user", username, "-e", "sh", "-c", command)
 
     def get_mount_points(self) -> Dict[str, Any]:
         """Get WSL mount points.
@@ -143,9 +166,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        return self.execute_windows_command(
-            f"--export {distro_name} {export_path}"
-        )
+        return self._send_wsl_argv("--export", distro_name, export_path)
 
     def import_distro(
         self, distro_name: str, import_path: str, root_path: str
@@ -160,9 +181,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        return self.execute_windows_command(
-            f"--import {distro_name} {root_path} {import_path}"
-        )
+        return self._send_wsl_argv("--import", distro_name, root_path, import_path)
 
     def get_wsl_version(self) -> str:
         """Get the WSL version.
@@ -170,7 +189,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             str: WSL version.
         """
-        result = self.execute_windows_command("--version")
+        result = self._send_wsl_argv("--version")
         return result.get("output", "unknown")
 
     def shutdown(self) -> Dict[str, Any]:
@@ -179,7 +198,7 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        return self.execute_windows_command("--shutdown")
+        return self._send_wsl_argv("--shutdown")
 
     def terminate_distro(self, distro_name: str) -> Dict[str, Any]:
         """Terminate a WSL distribution.
@@ -190,4 +209,4 @@ class WSLAdapter(TerminalAdapter):
         Returns:
             dict: Result of the operation.
         """
-        return self.execute_windows_command(f"--terminate {distro_name}")
+        return self._send_wsl_argv("--terminate", distro_name)
@@ -9,16 +9,67 @@ Windows-native alternative to macOS's `it2` (iTerm2 control tool).
 """
 
 from __future__ import annotations
+import importlib
 import sys
 import click
 
-from .commands import window, tab, pane, session, broadcast, monitor, config
+from . import __version__
 from .utils import get_shell_type
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules on first dispatch.
+
+    Subcommands are declared as ``name -> "module:attribute"`` import
+    paths so `wt2 --version` and `wt2 --help` never load the command
+    modules (and their transitive dependencies).
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, _, attr = self.lazy_subcommands[cmd_name].partition(":")
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, attr)
+
+
+# Subcommand groups, imported on first use
+_SUBCOMMANDS = {
+    "window": ".commands.window:window",
+    "tab": ".commands.tab:tab",
+    "pane": ".commands.pane:pane",
+    "session": ".commands.session:session",
+    "broadcast": ".commands.broadcast:broadcast",
+    "monitor": ".commands.monitor:monitor",
+    "config": ".commands.config:config",
+}
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=_SUBCOMMANDS,
+    invoke_without_command=True,
+)
 @click.version_option(
-    version="0.2.0",
+    __version__,
+    "--version",
+    "-V",
     prog_name="winterm2",
     message="winterm2 version %(version)s",
 )
@@ -85,14 +136,10 @@ def cli(
         wt2 new              -> wt2 window new
         wt2 newtab           -> wt2 tab new
     """
-    # Store context for subcommands
+    # Store context for subcommands; commands that drive the terminal
+    # fetch the shared WindowsTerminalCLI themselves on first use
     ctx.ensure_object(dict)
 
-    # Initialize the CLI interface
-    from .core.terminal import WindowsTerminalCLI, get_cli
-    cli_instance = get_cli()
-    ctx.obj["cli"] = cli_instance
-
     # Auto-detect shell if needed
     if shell == "auto":
         detected = get_shell_type()
@@ -104,7 +151,7 @@ def cli(
 
     # Print banner in verbose mode
     if verbose:
-        click.echo(f"winterm2 v0.2.0")
+        click.echo(f"winterm2 v{__version__}")
         click.echo(f"Shell: {shell}")
         click.echo(f"Profile: {profile or 'default'}")
         click.echo()
@@ -114,16 +161,6 @@ def cli(
         click.echo(ctx.get_help())
 
 
-# Register subcommand groups
-cli.add_command(window, "window")
-cli.add_command(tab, "tab")
-cli.add_command(pane, "pane")
-cli.add_command(session, "session")
-cli.add_command(broadcast, "broadcast")
-cli.add_command(monitor, "monitor")
-cli.add_command(config, "config")
-
-
 # ============================================================================
 # Shortcut Commands (aliased to full commands for convenience)
 # ============================================================================
@@ -214,6 +251,11 @@ def main() -> int:
     Returns:
         Exit code.
     """
+    # Answer a bare version query before Click builds its context
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        click.echo(f"winterm2 version {__version__}")
+        return 0
+
     try:
         cli()
         return 0
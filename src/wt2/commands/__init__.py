@@ -1,11 +1 @@
 """Commands package for winterm2."""
-
-from .window import window
-from .tab import tab
-from .pane import pane
-from .session import session
-from .broadcast import broadcast
-from .monitor import monitor
-from .config import config
-
-__all__ = ["window", "tab", "pane", "session", "broadcast", "monitor", "config"]
@@ -5,8 +5,10 @@ Provides commands for sending commands to multiple panes simultaneously.
 """
 
 from __future__ import annotations
+import asyncio
 import click
-from typing import Optional, List
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, List, Tuple
 
 from ..core.terminal import WindowsTerminalAPI, get_api
 
@@ -66,18 +68,11 @@ def broadcast_on(
     try:
         target_panes: List[str] = []
         if all_panes:
-            state = api.get_state()
-            for tab in state.get("tabs", []):
-                for pane in tab.get("panes", []):
-                    target_panes.append(pane.get("id"))
+            target_panes = _pane_ids(api.get_state())
         elif panes:
             target_panes = panes.split(",")
         elif tabs:
-            state = api.get_state()
-            for tab in state.get("tabs", []):
-                if str(tab.get("id")) in tabs.split(","):
-                    for pane in tab.get("panes", []):
-                        target_panes.append(pane.get("id"))
+            target_panes = _pane_ids(api.get_state(), frozenset(tabs.split(",")))
 
         if not target_panes:
             click.echo("No broadcast targets specified", err=True)
@@ -150,15 +145,13 @@ def broadcast_send(
     """
     api: WindowsTerminalAPI = ctx.obj.get("api", get_api())
     cmd_str = " ".join(command)
+    bulk_error: Optional[str] = None
 
     try:
         target_panes: List[str] = []
 
         if all_panes:
-            state = api.get_state()
-            for tab in state.get("tabs", []):
-                for pane in tab.get("panes", []):
-                    target_panes.append(pane.get("id"))
+            target_panes = _pane_ids(api.get_state())
         elif panes:
             target_panes = panes.split(",")
         elif ctx.obj.get("broadcast_active"):
@@ -177,27 +170,73 @@ def broadcast_send(
         if shell:
             cmd_str = _translate_command(shell, cmd_str)
 
-        # Send to each pane
-        results = []
-        for pane_id in target_panes:
-            result = api.send_text(cmd_str, pane_id=pane_id)
-            results.append({"pane": pane_id, "success": result.get("success", True)})
-
-        sent_count = sum(1 for r in results if r["success"])
-        click.echo(f"Sent to {sent_count}/{len(results)} panes")
+        # One wt.exe call for every pane; fall back to per-pane sends
+        # (and per-pane results) only if the batch never ran
+        bulk = api.send_text_bulk([(pane_id, cmd_str) for pane_id in target_panes])
+        if bulk.get("success", False):
+            results = [{"pane": pane_id, "success": True} for pane_id in target_panes]
+        elif bulk.get("launched", True):
+            # wt.exe failed or timed out part-way; some panes may already
+            # have the command, and resending could run it twice
+            bulk_error = bulk.get("error") or "unknown error"
+            results = []
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                replies = asyncio.run(_send_concurrently(api, cmd_str, target_panes))
+            else:
+                # Already inside an event loop; send serially instead
+                replies = [api.send_text(cmd_str, pane_id=pane_id) for pane_id in target_panes]
+            results = [
+                {"pane": pane_id, "success": reply.get("success", False)}
+                for pane_id, reply in zip(target_panes, replies)
+            ]
+
+        if bulk_error is None:
+            sent_count = sum(1 for r in results if r["success"])
+            click.echo(f"Sent to {sent_count}/{len(results)} panes")
 
     except Exception as e:
         click.echo(f"Error sending broadcast: {e}", err=True)
         ctx.exit(2)
 
+    if bulk_error is not None:
+        click.echo(
+            f"Broadcast failed: {bulk_error} (some panes may already have received it; not resent)",
+            err=True,
+        )
+        ctx.exit(2)
+
+
+# Generic command -> shell-specific equivalent, keyed by (shell, command)
+_TRANSLATIONS: Mapping[Tuple[str, str], str] = MappingProxyType({
+    ("cmd", "clear"): "cls",
+    ("cmd", "ls"): "dir",
+    ("powershell", "clear"): "Clear-Host",
+    ("powershell", "ls"): "Get-ChildItem",
+    ("wsl", "clear"): "clear",
+})
+
+
+async def _send_concurrently(
+    api: WindowsTerminalAPI, text: str, pane_ids: List[str]
+) -> List[dict]:
+    """Send text to every pane at once; results follow pane_ids order."""
+    return await asyncio.gather(*(api.async_send_text(text, pane_id=p) for p in pane_ids))
+
+
+def _pane_ids(state: dict, tab_ids: Optional[FrozenSet[str]] = None) -> List[str]:
+    """Collect pane IDs from a state tree, optionally only from some tabs."""
+    return [
+        pane["id"]
+        for tab in state.get("tabs", ())
+        if tab_ids is None or str(tab.get("id")) in tab_ids
+        for pane in tab.get("panes", ())
+        if pane.get("id")
+    ]
+
 
 def _translate_command(shell: str, command: str) -> str:
     """Translate generic commands to shell-specific equivalents."""
-    translations = {
-        ("cmd", "clear"): "cls",
-        ("cmd", "ls"): "dir",
-        ("powershell", "clear"): "Clear-Host",
-        ("powershell", "ls"): "Get-ChildItem",
-        ("wsl", "clear"): "clear",
-    }
-    return translations.get((shell, command), command)
+    return _TRANSLATIONS.get((shell, command), command)
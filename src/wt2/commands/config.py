@@ -5,15 +5,124 @@ Provides commands for loading, saving, and managing configuration files.
 """
 
 from __future__ import annotations
+import copy
+import functools
+import itertools
+import json
+import operator
 import os
+import shlex
+import subprocess
 import click
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Callable, Dict, Any, Tuple
 
 import yaml
 
+# Prefer the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Home directory, resolved once (on Windows this can hit the registry)
+_HOME_STR = os.path.expanduser("~")
+
 # Default config path
-DEFAULT_CONFIG_PATH = Path(os.path.expanduser("~/.wt2rc.yaml"))
+DEFAULT_CONFIG_PATH = Path(_HOME_STR, ".wt2rc.yaml")
+
+# Top-level `wt2` group for aliases; imported lazily (wt2.cli imports us)
+_ROOT_CLI: Optional[click.Group] = None
+
+# (parsed document, source digest) keyed by (path, mtime_ns, size),
+# least recently used first
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[Any, bytes]]" = OrderedDict()
+_YAML_CACHE_SIZE = 16
+
+
+def _digest(data: bytes) -> bytes:
+    """Return the hex digest used to recognise unchanged config sources."""
+    return blake2b(data, digest_size=16).hexdigest().encode("ascii")
+
+
+def _cache_key(path: Path) -> Tuple[str, int, int]:
+    """Build the _YAML_CACHE key for the file currently at ``path``."""
+    st = os.stat(path)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse if the file is unchanged.
+
+    Args:
+        path: File to load.
+
+    Returns:
+        A private copy of the parsed document, safe to mutate.
+    """
+    key = _cache_key(path)
+    if key in _YAML_CACHE:
+        _YAML_CACHE.move_to_end(key)
+    else:
+        _YAML_CACHE[key] = _parse_yaml(path)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(_YAML_CACHE[key][0])
+
+
+def _forget_cached(path: Path) -> None:
+    """Drop every cached parse of ``path``."""
+    name = str(path)
+    for key in [k for k in _YAML_CACHE if k[0] == name]:
+        del _YAML_CACHE[key]
+
+
+def _known_digest(path: Path) -> Optional[bytes]:
+    """Return the digest of ``path`` if its current contents were loaded before."""
+    try:
+        entry = _YAML_CACHE.get(_cache_key(path))
+    except OSError:
+        return None
+    return entry[1] if entry else None
+
+
+def _parse_yaml(path: Path) -> Tuple[Any, bytes]:
+    """
+    Parse a YAML file with the safe loader.
+
+    Args:
+        path: File to load.
+
+    Returns:
+        The parsed document and the digest of its source bytes.
+    """
+    source = path.read_bytes()
+    return yaml.load(source, Loader=_Loader), _digest(source)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_getter(dotted: str) -> Callable[[Any], Any]:
+    """
+    Build an accessor for a dotted config key, e.g. ``"a.b"`` -> ``d["a"]["b"]``.
+
+    Args:
+        dotted: Dotted key path.
+
+    Returns:
+        A function that looks the path up, raising KeyError or TypeError
+        when a step is missing or not a mapping.
+    """
+    getters = tuple(operator.itemgetter(part) for part in dotted.split("."))
+
+    def get(value: Any) -> Any:
+        for getter in getters:
+            value = getter(value)
+        return value
+
+    return get
 
 
 @click.group()
@@ -63,19 +172,22 @@ def init_config(ctx: click.Context, path: Optional[str]) -> None:
         "version": "1.0",
         "defaults": {
             "shell": "powershell",
-            "startup_dir": str(Path.home()),
+            "startup_dir": _HOME_STR,
         },
         "profiles": {},
         "workflows": {},
     }
 
     try:
-        # Create parent directories
-        config_file.parent.mkdir(parents=True, exist_ok=True)
+        # Create parent directories (usually the home directory, which exists)
+        parent = config_file.parent
+        if not parent.is_dir():
+            parent.mkdir(parents=True, exist_ok=True)
 
-        # Write config file
-        with open(config_file, "w", encoding="utf-8") as f:
-            yaml.dump(default_config, f, default_flow_style=False, sort_keys=False)
+        # Write config file; a large buffer turns PyYAML's many small
+        # writes into one
+        with config_file.open("w", encoding="utf-8", buffering=1 << 15) as f:
+            yaml.dump(default_config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
         click.echo(f"Created configuration file: {config_file}")
 
@@ -105,8 +217,7 @@ def load_config(ctx: click.Context, path: str, profile: Optional[str]) -> None:
     config_path = Path(path)
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_cached(config_path)
 
         if not isinstance(config, dict):
             click.echo("Invalid configuration file", err=True)
@@ -152,18 +263,13 @@ def get_config(ctx: click.Context, key: str) -> None:
     config = ctx.obj.get("config", {})
 
     try:
-        # Navigate nested keys
-        keys = key.split(".")
-        value = config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                value = None
-                break
+        # Walk the live config so edits made by other commands are seen
+        try:
+            value = _compile_getter(key)(config)
+        except (KeyError, TypeError):
+            value = None
 
         if value is not None:
-            import json
             click.echo(json.dumps(value, indent=2))
         else:
             click.echo(f"Key not found: {key}", err=True)
@@ -189,15 +295,16 @@ def set_config(ctx: click.Context, key: str, value: str) -> None:
 
     try:
         # Parse value as YAML
-        parsed_value = yaml.safe_load(value)
+        parsed_value = yaml.load(value, Loader=_Loader)
 
         # Navigate and set nested key
         keys = key.split(".")
         current = config
         for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
+            try:
+                current = current[k]
+            except KeyError:
+                current[k] = current = {}
 
         current[keys[-1]] = parsed_value
         ctx.obj["config"] = config
@@ -224,8 +331,16 @@ def save_config(ctx: click.Context, path: Optional[str]) -> None:
     config_path = Path(path) if path else ctx.obj.get("config_path", str(DEFAULT_CONFIG_PATH))
 
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        # Serialise in memory (same bytes a text-mode write would produce)
+        # so an unchanged config does not rewrite the file
+        text = yaml.dump(config, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+        data = text.replace("\n", os.linesep).encode("utf-8")
+        if _known_digest(Path(config_path)) == _digest(data):
+            click.echo(f"Configuration unchanged: {config_path}")
+            return
+
+        with open(config_path, "wb") as f:
+            f.write(data)
 
         click.echo(f"Saved configuration to: {config_path}")
 
@@ -235,13 +350,21 @@ def save_config(ctx: click.Context, path: Optional[str]) -> None:
 
 
 @config.command("edit")
+@click.option(
+    "--exec",
+    "exec_editor",
+    is_flag=True,
+    default=False,
+    help="Replace wt2 with the editor (POSIX only; skips the reload)",
+)
 @click.pass_context
-def edit_config(ctx: click.Context) -> None:
+def edit_config(ctx: click.Context, exec_editor: bool) -> None:
     """
     Edit the configuration file in the default editor.
 
     Examples:
         wt2 config edit
+        wt2 config edit --exec
     """
     config_path = ctx.obj.get("config_path", str(DEFAULT_CONFIG_PATH))
 
@@ -249,11 +372,15 @@ def edit_config(ctx: click.Context) -> None:
         # Get editor
         editor = os.environ.get("EDITOR", os.environ.get("VISUAL", "notepad"))
 
-        import subprocess
+        if exec_editor and os.name == "posix":
+            os.execvp(editor, [editor, config_path])
+
         result = subprocess.run([editor, config_path], check=False)
 
         if result.returncode == 0:
-            # Reload config if edited successfully
+            # Reload config if edited successfully; parses of the old
+            # contents can no longer be hit, so drop them first
+            _forget_cached(Path(config_path))
             ctx.invoke(load_config, path=config_path)
 
     except Exception as e:
@@ -272,18 +399,18 @@ def list_config(ctx: click.Context) -> None:
     """
     config = ctx.obj.get("config", {})
 
-    click.echo("Configuration:")
-    click.echo("-" * 40)
-
+    # Build the whole listing first so it is written with one echo
+    lines = ["Configuration:", "-" * 40]
     for key, value in config.items():
         if isinstance(value, dict):
-            click.echo(f"  {key}:")
-            for sub_key in list(value.keys())[:5]:  # Show first 5
-                click.echo(f"    - {sub_key}")
+            lines.append(f"  {key}:")
+            lines.extend(f"    - {sub_key}" for sub_key in itertools.islice(value, 5))  # Show first 5
             if len(value) > 5:
-                click.echo(f"    ... ({len(value)} total items)")
+                lines.append(f"    ... ({len(value)} total items)")
         else:
-            click.echo(f"  {key}: {value}")
+            lines.append(f"  {key}: {value}")
+
+    click.echo("\n".join(lines))
 
 
 @config.command("reload")
@@ -297,8 +424,7 @@ def reload_config(ctx: click.Context) -> None:
     """
     config_path = ctx.obj.get("config_path", str(DEFAULT_CONFIG_PATH))
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_cached(Path(config_path))
         ctx.obj["config"] = config
         click.echo("Configuration reloaded")
 
@@ -346,21 +472,19 @@ def cmd_alias(ctx: click.Context, alias_name: str | None) -> None:
         click.echo(f"Running alias '{alias_name}': {alias_cmd}")
 
         # Parse and execute the alias command
-        import shlex
         try:
             args = shlex.split(alias_cmd)
             # Remove 'wt2' prefix if present
             if args and args[0] == "wt2":
                 args = args[1:]
 
-            # Create a new argument list for Click
-            original_argv = __import__("sys").argv
-            __import__("sys").argv = ["wt2"] + args
-
-            from ..cli import cli
-            cli(standalone_mode=False)
-
-            __import__("sys").argv = original_argv
+            # Let Click parse the alias from the root group down, so group
+            # options (e.g. ``--profile X tab new``) and callbacks still apply
+            cli = _root_cli()
+            with cli.make_context("wt2", args, parent=ctx) as alias_ctx:
+                cli.invoke(alias_ctx)
+        except click.exceptions.Exit:
+            raise
         except Exception as e:
             click.echo(f"Failed to execute alias: {e}", err=True)
             ctx.exit(4)
@@ -370,6 +494,15 @@ def cmd_alias(ctx: click.Context, alias_name: str | None) -> None:
             click.echo(f"  {name}: {cmd}")
 
 
+def _root_cli() -> click.Group:
+    """Return the top-level `wt2` group, imported once on first use."""
+    global _ROOT_CLI
+    if _ROOT_CLI is None:
+        from ..cli import cli
+        _ROOT_CLI = cli
+    return _ROOT_CLI
+
+
 @config.group()
 def profile():
     """Profile management commands."""
@@ -405,7 +538,6 @@ def profile_show(ctx: click.Context, name: str) -> None:
         ctx.exit(3)
         return
 
-    import json
     profile_data = profiles[name]
     click.echo(json.dumps(profile_data, indent=2))
 
@@ -6,12 +6,60 @@ Provides real-time output monitoring and filtering capabilities.
 
 from __future__ import annotations
 import click
+import json
+import re
 import threading
 import queue
 import time
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Optional, Callable, List
 
-from ..core.terminal import WindowsTerminalAPI, get_api
+if TYPE_CHECKING:
+    from ..core.terminal import WindowsTerminalAPI
+
+
+def _get_api() -> WindowsTerminalAPI:
+    """Return the shared terminal API, importing it on first use."""
+    from ..core.terminal import get_api
+    return get_api()
+
+
+def _tail_lines(text: str, count: int) -> List[str]:
+    """
+    Return the last ``count`` lines of ``text``, ignoring surrounding whitespace.
+
+    Scans backwards from the end of the buffer, so only the returned lines
+    are sliced out rather than splitting the whole scrollback.
+
+    Args:
+        text: Output buffer.
+        count: Number of lines to keep (0 or less keeps all of them).
+
+    Returns:
+        The lines in their original order.
+    """
+    if count <= 0:
+        return text.strip().split("\n")
+
+    begin, end = 0, len(text)
+    while end and text[end - 1].isspace():
+        end -= 1
+    while begin < end and text[begin].isspace():
+        begin += 1
+    if begin == end:
+        return [""]
+
+    tail: List[str] = []
+    while end >= begin and len(tail) < count:
+        start = max(text.rfind("\n", begin, end) + 1, begin)
+        tail.append(text[start:end])
+        end = start - 1
+    tail.reverse()
+    return tail
+
+
+# Longest single Event.wait(); an untimed wait cannot be interrupted by
+# Ctrl+C on Windows, so unbounded waits are taken in slices of this size
+_WAIT_SLICE = 1.0
 
 
 class OutputMonitor:
@@ -33,6 +81,7 @@ class OutputMonitor:
         """
         self.pane_id = pane_id
         self.keyword = keyword.lower() if keyword else None
+        self._keyword_re = re.compile(re.escape(keyword), re.IGNORECASE) if keyword else None
         self.timeout = timeout
         self._running = False
         self._output_queue: queue.Queue = queue.Queue()
@@ -54,6 +103,27 @@ class OutputMonitor:
         """Check if monitoring is active."""
         return self._running
 
+    def wait(self, timeout: float = 0.0) -> bool:
+        """
+        Block until stop() is called or the timeout elapses.
+
+        Args:
+            timeout: Maximum time to wait in seconds (0 = no limit)
+
+        Returns:
+            True if monitoring was stopped, False if the timeout elapsed
+        """
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        while True:
+            if deadline is None:
+                remaining = _WAIT_SLICE
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return self._stop_event.is_set()
+            if self._stop_event.wait(min(remaining, _WAIT_SLICE)):
+                return True
+
     def process_output(self, text: str) -> bool:
         """
         Process output line.
@@ -66,8 +136,8 @@ class OutputMonitor:
         """
         self._lines_total += 1
 
-        if self.keyword:
-            if self.keyword in text.lower():
+        if self._keyword_re is not None:
+            if self._keyword_re.search(text):
                 self._lines_matched += 1
                 return True
             return False
@@ -124,7 +194,7 @@ def follow_output(
         wt2 monitor follow --pane-id 1
         wt2 monitor follow --timeout 60
     """
-    api: WindowsTerminalAPI = ctx.obj.get("api", get_api())
+    api: WindowsTerminalAPI = ctx.obj.get("api") or _get_api()
 
     try:
         monitor_instance = OutputMonitor(pane_id=pane_id, timeout=timeout)
@@ -132,29 +202,15 @@ def follow_output(
 
         click.echo(f"Following output (Ctrl+C to stop)...")
 
-        # Start monitoring in background thread
-        def _monitor_loop():
-            while monitor_instance.is_running() and not monitor_instance._stop_event.is_set():
-                try:
-                    # Simulate output monitoring
-                    # In real implementation, this would read from terminal output
-                    time.sleep(0.1)
-                except Exception:
-                    break
-
-        monitor_thread = threading.Thread(target=_monitor_loop, daemon=True)
-        monitor_thread.start()
+        # In real implementation, a reader thread would feed terminal
+        # output through monitor_instance.process_output()
 
         # Wait for interrupt or timeout
         try:
-            while monitor_instance.is_running():
-                time.sleep(0.5)
-                if timeout > 0:
-                    if monitor_instance._lines_total > 0:
-                        pass  # Would show progress
+            monitor_instance.wait(timeout)
         except KeyboardInterrupt:
-            monitor_instance.stop()
             click.echo("\nStopped monitoring")
+        monitor_instance.stop()
 
     except Exception as e:
         click.echo(f"Error monitoring output: {e}", err=True)
@@ -199,7 +255,7 @@ def watch_keyword(
         wt2 monitor watch "Exception" --timeout 30
         wt2 monitor watch "SUCCESS" --count 5
     """
-    api: WindowsTerminalAPI = ctx.obj.get("api", get_api())
+    api: WindowsTerminalAPI = ctx.obj.get("api") or _get_api()
 
     try:
         monitor_instance = OutputMonitor(pane_id=pane_id, keyword=keyword, timeout=timeout)
@@ -215,25 +271,17 @@ def watch_keyword(
 
         def _check_for_match(text: str) -> bool:
             nonlocal matches
-            if keyword.lower() in text.lower():
+            if monitor_instance.process_output(text):
                 matches += 1
+                if count > 0 and matches >= count:
+                    monitor_instance.stop()
                 return True
             return False
 
-        # Simulated monitoring loop
-        start_time = time.time()
+        # Block until the match count is reached, the timeout elapses
+        # or the user interrupts
         try:
-            while monitor_instance.is_running():
-                time.sleep(0.5)
-
-                # Check timeout
-                if timeout > 0 and (time.time() - start_time) >= timeout:
-                    break
-
-                # Check match count
-                if count > 0 and matches >= count:
-                    break
-
+            monitor_instance.wait(timeout)
         except KeyboardInterrupt:
             pass
 
@@ -275,19 +323,16 @@ def tail_output(
         wt2 monitor tail 50
         wt2 monitor tail --pane-id 1 --json
     """
-    api: WindowsTerminalAPI = ctx.obj.get("api", get_api())
+    api: WindowsTerminalAPI = ctx.obj.get("api") or _get_api()
 
     try:
         # Get recent output from terminal
         result = api.send_command("getOutput", paneId=pane_id, limit=lines)
 
         if output_json:
-            import json
             click.echo(json.dumps(result, indent=2))
         else:
-            output = result.get("output", "")
-            output_lines = output.strip().split("\n")[-lines:]
-            for line in output_lines:
+            for line in _tail_lines(result.get("output", ""), lines):
                 click.echo(line)
 
     except Exception as e:
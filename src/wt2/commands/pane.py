@@ -1,9 +1,55 @@
 """Pane-related commands for winterm2."""
 
-from typing import Optional
+from __future__ import annotations
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional
 import click
 
-from ..core.terminal import WindowsTerminalCLI, get_cli
+if TYPE_CHECKING:
+    from ..core.terminal import WindowsTerminalCLI
+
+# Friendly split direction names -> wt.exe split-pane directions
+_DIRECTION_MAP: Mapping[str, str] = MappingProxyType({
+    "horizontal": "right",
+    "vertical": "down",
+})
+
+
+def _get_cli() -> WindowsTerminalCLI:
+    """Return the shared CLI wrapper, importing the terminal layer on first use."""
+    from ..core.terminal import get_cli
+    return get_cli()
+
+
+def _wt_action(message: str) -> Callable:
+    """
+    Turn a function returning a wt.exe result dict into a pane command body.
+
+    The wrapped function receives the context and the CLI wrapper, followed
+    by the command's parameters. ``message`` is formatted with those
+    parameters and echoed on success; failures exit with code 1 and
+    unexpected errors with code 2. Returning None skips reporting.
+    """
+    def decorator(func: Callable[..., Optional[Dict[str, Any]]]) -> Callable:
+        @functools.wraps(func)
+        def wrapper(ctx: click.Context, **kwargs: Any) -> None:
+            cli: WindowsTerminalCLI = ctx.obj.get("cli") or _get_cli()
+            try:
+                result = func(ctx, cli, **kwargs)
+            except Exception as e:
+                click.echo(f"Error: {e}", err=True)
+                ctx.exit(2)
+                return
+            if result is None:
+                return
+            if result.get("success"):
+                click.echo(message.format(**kwargs))
+            else:
+                click.echo(f"Failed: {result.get('error')}", err=True)
+                ctx.exit(1)
+        return wrapper
+    return decorator
 
 
 @click.group()
@@ -31,23 +77,11 @@ def pane():
 @click.option("--size", "-s", type=float, default=None, help="Split size (0.0-1.0)")
 @click.option("--pane-id", type=str, default=None, help="Source pane ID")
 @click.pass_context
-def cmd_split_pane(ctx: click.Context, direction: str, profile: Optional[str], size: Optional[float], pane_id: Optional[str]) -> None:
+@_wt_action("Split pane ({direction})")
+def cmd_split_pane(ctx: click.Context, cli: WindowsTerminalCLI, direction: str, profile: Optional[str], size: Optional[float], pane_id: Optional[str]) -> Dict[str, Any]:
     """Split a pane."""
-    cli: WindowsTerminalCLI = ctx.obj.get("cli", get_cli())
-    try:
-        # Map direction names
-        direction_map = {"horizontal": "right", "vertical": "down"}
-        wt_direction = direction_map.get(direction, direction)
-
-        result = cli.split_pane(direction=wt_direction, profile=profile, size=size, pane_id=pane_id)
-        if result.get("success"):
-            click.echo(f"Split pane ({direction})")
-        else:
-            click.echo(f"Failed: {result.get('error')}", err=True)
-            ctx.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(2)
+    wt_direction = _DIRECTION_MAP.get(direction, direction)
+    return cli.split_pane(direction=wt_direction, profile=profile, size=size, pane_id=pane_id)
 
 
 @pane.command("vsplit")
@@ -64,42 +98,24 @@ def cmd_vsplit_pane(ctx: click.Context, profile: Optional[str], size: Optional[f
 @click.argument("pane_id", type=str, required=False)
 @click.option("--force", "-f", is_flag=True, default=False)
 @click.pass_context
-def cmd_close_pane(ctx: click.Context, pane_id: Optional[str], force: bool) -> None:
+@_wt_action("Pane closed")
+def cmd_close_pane(ctx: click.Context, cli: WindowsTerminalCLI, pane_id: Optional[str], force: bool) -> Optional[Dict[str, Any]]:
     """Close a pane."""
-    cli: WindowsTerminalCLI = ctx.obj.get("cli", get_cli())
-    try:
-        if not force:
-            if not click.confirm(f"Close pane {pane_id or 'current'}?"):
-                click.echo("Cancelled")
-                return
-        result = cli.close_pane(pane_id=pane_id)
-        if result.get("success"):
-            click.echo("Pane closed")
-        else:
-            click.echo(f"Failed: {result.get('error')}", err=True)
-            ctx.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(2)
+    if not force:
+        if not click.confirm(f"Close pane {pane_id or 'current'}?"):
+            click.echo("Cancelled")
+            return None
+    return cli.close_pane(pane_id=pane_id)
 
 
 @pane.command("focus")
 @click.argument("direction", type=click.Choice(["up", "down", "left", "right"]), required=True)
 @click.option("--pane-id", type=str, default=None)
 @click.pass_context
-def cmd_focus_pane(ctx: click.Context, direction: str, pane_id: Optional[str]) -> None:
+@_wt_action("Focused {direction} pane")
+def cmd_focus_pane(ctx: click.Context, cli: WindowsTerminalCLI, direction: str, pane_id: Optional[str]) -> Dict[str, Any]:
     """Focus adjacent pane."""
-    cli: WindowsTerminalCLI = ctx.obj.get("cli", get_cli())
-    try:
-        result = cli.focus_pane(direction=direction, pane_id=pane_id)
-        if result.get("success"):
-            click.echo(f"Focused {direction} pane")
-        else:
-            click.echo(f"Failed: {result.get('error')}", err=True)
-            ctx.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(2)
+    return cli.focus_pane(direction=direction, pane_id=pane_id)
 
 
 @pane.command("resize")
@@ -107,19 +123,10 @@ def cmd_focus_pane(ctx: click.Context, direction: str, pane_id: Optional[str]) -
 @click.argument("delta", type=int, default=1)
 @click.option("--pane-id", type=str, default=None)
 @click.pass_context
-def cmd_resize_pane(ctx: click.Context, direction: str, delta: int, pane_id: Optional[str]) -> None:
+@_wt_action("Resized pane {direction} by {delta}")
+def cmd_resize_pane(ctx: click.Context, cli: WindowsTerminalCLI, direction: str, delta: int, pane_id: Optional[str]) -> Dict[str, Any]:
     """Resize a pane."""
-    cli: WindowsTerminalCLI = ctx.obj.get("cli", get_cli())
-    try:
-        result = cli.resize_pane(direction=direction, delta=delta, pane_id=pane_id)
-        if result.get("success"):
-            click.echo(f"Resized pane {direction} by {delta}")
-        else:
-            click.echo(f"Failed: {result.get('error')}", err=True)
-            ctx.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(2)
+    return cli.resize_pane(direction=direction, delta=delta, pane_id=pane_id)
 
 
 @pane.command("list")
@@ -135,19 +142,10 @@ def cmd_list_panes(ctx: click.Context, output_json: bool, tab_id: Optional[str])
 @pane.command("zoom")
 @click.option("--pane-id", type=str, default=None)
 @click.pass_context
-def cmd_zoom_pane(ctx: click.Context, pane_id: Optional[str]) -> None:
+@_wt_action("Pane zoom toggled")
+def cmd_zoom_pane(ctx: click.Context, cli: WindowsTerminalCLI, pane_id: Optional[str]) -> Dict[str, Any]:
     """Toggle pane zoom (maximize/restore)."""
-    cli: WindowsTerminalCLI = ctx.obj.get("cli", get_cli())
-    try:
-        result = cli.toggle_pane_zoom(pane_id=pane_id)
-        if result.get("success"):
-            click.echo("Pane zoom toggled")
-        else:
-            click.echo(f"Failed: {result.get('error')}", err=True)
-            ctx.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(2)
+    return cli.toggle_pane_zoom(pane_id=pane_id)
 
 
 @pane.command("swap")
@@ -162,23 +160,13 @@ def cmd_swap_pane(ctx: click.Context, pane_id: str, target_pane_id: str) -> None
 @pane.command("split2x2")
 @click.option("--profile", "-p", type=str, default=None)
 @click.pass_context
-def cmd_split2x2(ctx: click.Context, profile: Optional[str]) -> None:
+@_wt_action("Created 2x2 pane grid (basic)")
+def cmd_split2x2(ctx: click.Context, cli: WindowsTerminalCLI, profile: Optional[str]) -> Dict[str, Any]:
     """Create a 2x2 grid of panes."""
-    cli: WindowsTerminalCLI = ctx.obj.get("cli", get_cli())
-    try:
-        # Split vertically first
-        result1 = cli.split_pane(direction="right", profile=profile)
-        if not result1.get("success"):
-            click.echo(f"Failed at first split: {result1.get('error')}", err=True)
-            ctx.exit(1)
-
-        # Split horizontally in right half
-        result2 = cli.split_pane(direction="down", profile=profile)
-        if not result2.get("success"):
-            click.echo(f"Failed at second split: {result2.get('error')}", err=True)
-            ctx.exit(1)
-
-        click.echo("Created 2x2 pane grid (basic)")
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(2)
+    # Split vertically first, then horizontally in the right half,
+    # chained into one wt.exe invocation
+    profile_args = ["--profile", profile] if profile else []
+    return cli.run_batch([
+        ["split-pane", "--right", *profile_args],
+        ["split-pane", "--down", *profile_args],
+    ])
@@ -1,7 +1,8 @@
 """Core business logic package."""
 
-from .session import SessionManager
-from .terminal import WindowsTerminalAPI
+import importlib
+from typing import Any
+
 from .exceptions import (
     WintermError,
     ConnectionError as WintermConnectionError,
@@ -10,6 +11,13 @@ from .exceptions import (
     InvalidArgumentError,
 )
 
+# The session and terminal layers are imported on first use, so modules
+# that only need the exceptions do not pull in wt.exe discovery.
+_LAZY_ATTRS = {
+    "SessionManager": ".session",
+    "WindowsTerminalAPI": ".terminal",
+}
+
 __all__ = [
     "SessionManager",
     "WindowsTerminalAPI",
@@ -19,3 +27,16 @@ __all__ = [
     "ShellNotFoundError",
     "InvalidArgumentError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
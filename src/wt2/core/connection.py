@@ -1,6 +1,8 @@
 """Terminal connection and API modules."""
 
+import atexit
 import json
+import threading
 from typing import Optional, Dict, Any
 
 
@@ -30,6 +32,11 @@ class TerminalConnection:
             self._connection = None
             return True
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the connection is currently open."""
+        return self._connected
+
     def disconnect(self) -> None:
         """Disconnect from Windows Terminal."""
         self._connected = False
@@ -74,6 +81,39 @@ class TerminalConnection:
         return self.send_message({"action": "listProfiles"})
 
 
+class SharedConnection:
+    """One lazily opened TerminalConnection shared by many callers.
+
+    Every instance is closed at interpreter exit.
+    """
+
+    def __init__(self):
+        """Initialize the shared connection holder."""
+        self._conn: Optional[TerminalConnection] = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def get(self) -> TerminalConnection:
+        """Return the shared connection, (re)connecting if it is closed.
+
+        Returns:
+            TerminalConnection: Open connection.
+        """
+        with self._lock:
+            if self._conn is None or not self._conn.is_connected:
+                conn = TerminalConnection()
+                conn.connect()
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        """Release the shared connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.disconnect()
+                self._conn = None
+
+
 class TerminalAPI:
     """High-level API for Windows Terminal operations."""
 
@@ -6,25 +6,34 @@ which is the recommended way to control Windows Terminal.
 """
 
 from __future__ import annotations
+import asyncio
+import glob
 import json
 import subprocess
 import os
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+# stderr reported when wt.exe could not be started at all
+_WT_NOT_FOUND = "wt.exe not found"
+
 
 class WindowsTerminalCLI:
     """Interface to Windows Terminal via wt.exe CLI."""
 
+    # Seconds a fetched window/tab/pane snapshot is reused
+    STATE_TTL = 0.25
+
     def __init__(self):
         """Initialize the Windows Terminal CLI interface."""
         self._wt_path: Optional[str] = None
+        self._pending: List[subprocess.Popen] = []
+        self._state_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self._find_wt()
 
     def _find_wt(self) -> Optional[str]:
         """Find wt.exe path."""
-        import glob
-
         # Common locations for wt.exe
         possible_paths = [
             # Windows Terminal Store version (find actual exe in package folder)
@@ -96,7 +105,75 @@ class WindowsTerminalCLI:
         except subprocess.TimeoutExpired:
             return subprocess.CompletedProcess(cmd, returncode=-1, stdout="", stderr="Command timed out")
         except FileNotFoundError:
-            return subprocess.CompletedProcess(cmd, returncode=-1, stdout="", stderr="wt.exe not found")
+            return subprocess.CompletedProcess(cmd, returncode=-1, stdout="", stderr=_WT_NOT_FOUND)
+
+    def submit(self, args: List[str]) -> subprocess.Popen:
+        """Launch wt.exe without waiting for it; reap the result with poll()."""
+        process = subprocess.Popen(
+            [self.wt_path] + args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self._pending.append(process)
+        return process
+
+    def poll(self, wait: bool = False, timeout: float = 10.0) -> List[Dict[str, Any]]:
+        """Collect results of submitted commands that have finished.
+
+        With ``wait=True`` every pending command is waited for.
+        """
+        completed: List[Dict[str, Any]] = []
+        still_running: List[subprocess.Popen] = []
+        for process in self._pending:
+            if wait:
+                try:
+                    process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+            if process.poll() is None:
+                still_running.append(process)
+                continue
+            stderr = process.stderr.read() if process.stderr else ""
+            if process.stderr:
+                process.stderr.close()
+            completed.append({
+                "success": process.returncode == 0,
+                "error": stderr.strip() if process.returncode != 0 else None,
+            })
+        self._pending = still_running
+        return completed
+
+    def run_batch(self, commands: List[List[str]], timeout: float = 10.0) -> Dict[str, Any]:
+        """Run several wt.exe subcommands in a single invocation.
+
+        Subcommands are joined with wt's ``;`` delimiter so the whole
+        sequence costs one process launch. Literal semicolons inside
+        arguments are escaped as ``\\;``.
+
+        The result has a single status for the whole batch. ``launched`` is
+        False only when wt.exe could not be started, in which case no
+        subcommand ran; any other failure (including a timeout) may come
+        after some subcommands already took effect.
+        """
+        args: List[str] = []
+        for command in commands:
+            if not command:
+                continue
+            if args:
+                args.append(";")
+            args.extend(arg.replace(";", "\\;") for arg in command)
+
+        if not args:
+            return {"success": True, "error": None, "launched": True}
+
+        result = self._run_wt(args, timeout=timeout)
+        return {
+            "success": result.returncode == 0,
+            "error": result.stderr.strip() if result.returncode != 0 else None,
+            "launched": result.stderr != _WT_NOT_FOUND,
+        }
 
     # =========================================================================
     # Window Commands
@@ -145,6 +222,30 @@ class WindowsTerminalCLI:
             "note": "Use Windows Terminal directly or enable Experimental JSON API for full state access"
         }
 
+    def get_state(self) -> Dict[str, Any]:
+        """Get the window/tab/pane tree, reusing a snapshot for STATE_TTL seconds."""
+        now = time.monotonic()
+        if self._state_cache is not None and now - self._state_cache[0] < self.STATE_TTL:
+            return self._state_cache[1]
+        state = self._query_state()
+        self._state_cache = (now, state)
+        return state
+
+    def invalidate_state(self) -> None:
+        """Drop the cached state snapshot."""
+        self._state_cache = None
+
+    def _query_state(self) -> Dict[str, Any]:
+        """Fetch the window/tab/pane tree."""
+        # wt.exe cannot report its layout; an empty tree keeps callers
+        # working until the Experimental JSON API is available
+        return {
+            "success": False,
+            "error": "State queries are not available through wt.exe",
+            "windows": [],
+            "tabs": [],
+        }
+
     def focus_window(self, window_id: str) -> Dict[str, Any]:
         """Focus a window."""
         # wt.exe doesn't have a direct focus command
@@ -292,6 +393,27 @@ class WindowsTerminalCLI:
         result = self._run_wt(args + [text])
         return {"success": result.returncode == 0, "error": result.stderr.strip() if result.returncode != 0 else None}
 
+    async def async_send_text(self, text: str, pane_id: Optional[str] = None) -> Dict[str, Any]:
+        """Send text to a pane without blocking the event loop.
+
+        Runs send_text() in a worker thread so several sends can be awaited
+        together.
+        """
+        return await asyncio.to_thread(self.send_text, text, pane_id)
+
+    def send_text_bulk(self, items: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Send text to several panes with one wt.exe invocation.
+
+        Delivery is reported all-or-nothing, as for run_batch(): there is
+        no per-pane status. On failure with ``launched`` True some panes
+        may already have received their text, so callers must not resend
+        it blindly.
+
+        Args:
+            items: ``(pane_id, text)`` pairs.
+        """
+        return self.run_batch([["send-input", "--id", pane_id, text] for pane_id, text in items])
+
     def clear_screen(self, pane_id: Optional[str] = None) -> Dict[str, Any]:
         """Clear screen."""
         # Send ANSI clear sequence
@@ -7,6 +7,7 @@ handling drive letters, UNC paths, and various edge cases.
 
 import os
 import re
+import subprocess
 from typing import Optional
 
 
@@ -119,7 +120,6 @@ def detect_wsl_distro() -> str:
         returns an empty string.
     """
     try:
-        import subprocess
         result = subprocess.run(
             ["wsl.exe", "--list", "--quiet"],
             capture_output=True,
@@ -151,7 +151,6 @@ def get_wsl_home_distro() -> str:
 
     # Try to get the home directory
     try:
-        import subprocess
         result = subprocess.run(
             ["wsl.exe", "-e", "bash", "-c", "echo $HOME"],
             capture_output=True,
@@ -187,7 +187,8 @@ def get_powershell_version() -> Tuple[int, int]:
     try:
         import subprocess
         result = subprocess.run(
-            ['pwsh', '-NoLogo', '-Command', '$PSVersionTable.PSVersion'],
+            ['pwsh', '-NoLogo', '-NoProfile', '-NonInteractive', '-Command',
+             '$PSVersionTable.PSVersion'],
             capture_output=True,
             text=True,
             timeout=10
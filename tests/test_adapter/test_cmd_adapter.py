@@ -0,0 +1,279 @@
+"""Unit tests for CMD adapter."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class TestCMDAdapterSpecific:
+    """Tests for CMD adapter functionality."""
+
+    def test_is_available_probes_once(self):
+        """Test availability lookup is cached and does not spawn cmd.exe."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch("wt2.adapter.cmd.shutil.which") as mock_which, \
+                patch("wt2.adapter.cmd.subprocess.run") as mock_run:
+            mock_which.return_value = "C:\\Windows\\System32\\cmd.exe"
+
+            assert adapter.is_available() is True
+            assert adapter.is_available() is True
+            assert mock_which.call_count == 1
+            mock_run.assert_not_called()
+
+    def test_is_available_deep_runs_probe(self):
+        """Test deep availability check executes cmd.exe."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch("wt2.adapter.cmd.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            assert adapter.is_available(deep=True) is True
+            mock_run.assert_called_once()
+
+    def test_execute_reuses_persistent_shell(self):
+        """Test commands are fed to one long-lived cmd.exe process."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        adapter._available = True
+        with patch("wt2.adapter.cmd.uuid.uuid4") as mock_uuid, \
+                patch("wt2.adapter.cmd.subprocess.Popen") as mock_popen:
+            mock_uuid.return_value = MagicMock(hex="abc")
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([
+                b"C:\\Users\\Test\r\n",
+                b"__WT2_END_abc__ 0\r\n",
+                b"__WT2_END_abc__ 3\r\n",
+            ])
+            mock_popen.return_value = mock_proc
+
+            first = adapter.execute("echo %CD%")
+            second = adapter.execute("exit /B 3")
+
+            assert first["stdout"] == "C:\\Users\\Test\n"
+            assert first["exit_code"] == 0
+            assert second["success"] is False
+            assert second["exit_code"] == 3
+            assert mock_popen.call_count == 1
+
+    def test_set_environment_single_invocation(self):
+        """Test all variables are set with one command."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True}
+
+            assert adapter.set_environment("s1", FOO="1", BAR="a b") is True
+            mock_execute.assert_called_once_with('set "FOO=1" && set "BAR=a b"')
+
+    def test_get_drive_list_bitmask(self):
+        """Test drive letters are decoded from GetLogicalDrives."""
+        import ctypes
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        mock_windll = MagicMock()
+        mock_windll.kernel32.GetLogicalDrives.return_value = 0b1100
+        with patch.object(ctypes, "windll", mock_windll, create=True), \
+                patch.object(adapter, "execute") as mock_execute:
+            assert adapter.get_drive_list() == ["C:", "D:"]
+            mock_execute.assert_not_called()
+
+    def test_get_directory_contents(self, tmp_path):
+        """Test directory listing without shelling out."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "file.txt").write_text("hello")
+        (tmp_path / ".hidden").write_text("x")
+
+        adapter = CMDAdapter()
+        items = sorted(adapter.get_directory_contents(str(tmp_path)), key=lambda i: i["name"])
+
+        assert items == [
+            {"name": "file.txt", "is_dir": False, "size": 5},
+            {"name": "sub", "is_dir": True, "size": 0},
+        ]
+        assert len(adapter.get_directory_contents(str(tmp_path), show_hidden=True)) == 3
+        assert adapter.get_directory_contents(str(tmp_path / "missing")) == []
+
+    def test_file_operations_in_process(self, tmp_path):
+        """Test file helpers work without spawning cmd.exe."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        source = tmp_path / "a.txt"
+        source.write_text("data")
+        folder = tmp_path / "nested" / "dir"
+
+        with patch.object(adapter, "execute") as mock_execute:
+            assert adapter.create_directory(str(folder)) is True
+            assert adapter.copy_file(str(source), str(folder)) is True
+            assert adapter.copy_file(str(source), str(folder)) is False
+            assert adapter.copy_file(str(source), str(folder), overwrite=True) is True
+            assert adapter.rename(str(folder / "a.txt"), "b.txt") is True
+            assert adapter.move_file(str(folder / "b.txt"), str(tmp_path / "c.txt")) is True
+            assert adapter.delete_file(str(tmp_path / "c.txt")) is True
+            assert adapter.delete_file(str(tmp_path / "c.txt")) is False
+            assert adapter.delete_directory(str(tmp_path / "nested"), recursive=True) is True
+            mock_execute.assert_not_called()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt"]
+
+    def test_get_state_batches_variables(self):
+        """Test several variables are read with one echo."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True, "stdout": "C:\\work|0\r\n"}
+
+            state = adapter.get_state("s1", "CD", "errorlevel")
+            assert state == {"CD": "C:\\work", "errorlevel": "0"}
+            mock_execute.assert_called_once_with("echo %CD%^|%errorlevel%")
+
+    def test_get_state_reads_saved_prompt_and_undefined(self):
+        """Test the saved prompt is queried and undefined variables are empty."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True, "stdout": "$P$G|%FOO%\r\n"}
+
+            assert adapter.get_state("s1", "prompt", "FOO") == {"prompt": "$P$G", "FOO": ""}
+            mock_execute.assert_called_once_with("echo %__WT2_PROMPT%^|%FOO%")
+
+    def test_get_environment_cached_until_execute(self):
+        """Test environment lookups are memoized until the next command."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        adapter._available = True
+        with patch.object(adapter, "_execute_persistent") as mock_exec:
+            mock_exec.return_value = {"success": True, "stdout": "C:\\bin\r\n"}
+
+            assert adapter.get_environment("s1") == {"PATH": "C:\\bin"}
+            assert adapter.get_environment("s1") == {"PATH": "C:\\bin"}
+            assert mock_exec.call_count == 1
+
+            adapter.execute("set PATH=C:\\other")
+            adapter.get_environment("s1")
+            assert mock_exec.call_count == 3
+
+    def test_session_lifecycle_uses_popen_handle(self):
+        """Test sessions keep their Popen object for input and teardown."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch("wt2.adapter.cmd.subprocess.Popen") as mock_popen:
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_popen.return_value = mock_proc
+
+            session_id = adapter.start_session()
+            assert adapter.send_input(session_id, "dir\r\n") is True
+            mock_proc.stdin.write.assert_called_once_with("dir\r\n")
+
+            assert adapter.end_session(session_id) is True
+            mock_proc.terminate.assert_called_once()
+            assert adapter.end_session(session_id) is False
+            assert adapter.send_input(session_id, "dir\r\n") is False
+
+    def test_info_is_cached_until_refresh(self):
+        """Test adapter info is built once and rebuilt after refresh."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch("wt2.adapter.cmd.shutil.which") as mock_which:
+            mock_which.return_value = None
+
+            info = adapter.info
+            assert info.is_available is False
+            assert adapter.info is info
+
+            mock_which.return_value = "cmd.exe"
+            adapter.refresh_info()
+            assert adapter.info.is_available is True
+            assert mock_which.call_count == 2
+
+    def test_execute_many_stops_on_error(self):
+        """Test batched commands report per-command exit codes."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        adapter._available = True
+        with patch("wt2.adapter.cmd.uuid.uuid4") as mock_uuid, \
+                patch("wt2.adapter.cmd.subprocess.Popen") as mock_popen:
+            mock_uuid.return_value = MagicMock(hex="abc")
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([
+                b"one\r\n",
+                b"__WT2_END_abc__ 0\r\n",
+                b"__WT2_END_abc__ 2\r\n",
+            ])
+            mock_popen.return_value = mock_proc
+
+            results = adapter.execute_many(["echo one", "type missing", "echo three"])
+
+            assert [r["exit_code"] for r in results] == [0, 2]
+            assert results[0]["stdout"] == "one\n"
+            assert mock_proc.stdin.write.call_count == 2
+            assert mock_popen.call_count == 1
+
+    def test_execute_reports_shell_exit_without_rerun(self):
+        """Test a shell that dies mid-command is not re-run one-shot."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        adapter._available = True
+        with patch("wt2.adapter.cmd.subprocess.Popen") as mock_popen, \
+                patch.object(adapter, "_execute_once") as mock_once:
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([b"partial\r\n"])
+            mock_popen.return_value = mock_proc
+
+            result = adapter.execute("set /p X=")
+
+            assert result["success"] is False
+            assert result["stdout"] == "partial\n"
+            assert result["exit_code"] == -1
+            mock_once.assert_not_called()
+            payload = mock_proc.stdin.write.call_args[0][0].decode()
+            assert payload.startswith("(set /p X=) <nul\r\n")
+
+    def test_snapshot(self):
+        """Test snapshot combines shell state and drive list."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch.object(adapter, "execute") as mock_execute, \
+                patch.object(adapter, "get_drive_list", return_value=["C:"]):
+            mock_execute.return_value = {"success": True, "stdout": "C:\\work|$P$G|1\r\n"}
+
+            assert adapter.snapshot("s1") == {
+                "cwd": "C:\\work",
+                "prompt": "$P$G",
+                "exit_code": 1,
+                "drives": ["C:"],
+            }
+            mock_execute.assert_called_once()
+
+    def test_shell_commands_are_quoted(self):
+        """Test shell fallbacks quote their path arguments."""
+        from wt2.adapter.cmd import CMDAdapter
+
+        adapter = CMDAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True}
+
+            adapter.copy_file("C:\\a b.txt", "D:\\", overwrite=True, use_shell=True)
+            mock_execute.assert_called_with('copy /Y "C:\\a b.txt" "D:\\"')
+
+            adapter.delete_file('odd".txt', use_shell=True)
+            mock_execute.assert_called_with('del "odd"".txt"')
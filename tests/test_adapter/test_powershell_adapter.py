@@ -116,3 +116,228 @@ class TestPowerShellAdapterSpecific:
             ]
             result = adapter.execute_multi(commands)
             assert result["success"] is True
+
+    def test_execute_multi_uses_script_block(self):
+        """Test batched commands are sent as one multi-line script block."""
+        from wt2.adapters.powershell_adapter import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "execute_command") as mock_execute:
+            adapter.execute_multi(["$x = 1", "Write-Output \"a; b\""])
+            mock_execute.assert_called_once_with('& {\n$x = 1\nWrite-Output "a; b"\n}')
+
+    def test_execute_command_plain_fast_path(self):
+        """Test simple commands skip base64 encoding."""
+        from wt2.adapters.powershell_adapter import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(PowerShellAdapter, "_get_conn") as mock_conn:
+            send = mock_conn.return_value.send_message
+
+            adapter.execute_command("Get-ChildItem C:/temp")
+            assert send.call_args[0][0]["input"].endswith("-Command Get-ChildItem C:/temp")
+
+            adapter.execute_command("Write-Output 'hi'")
+            assert "-EncodedCommand" in send.call_args[0][0]["input"]
+
+            adapter.execute_command("Get-ChildItem\n")
+            assert "-EncodedCommand" in send.call_args[0][0]["input"]
+
+    def test_connection_is_shared(self):
+        """Test all calls reuse one lazily opened connection."""
+        from wt2.adapters.powershell_adapter import PowerShellAdapter
+
+        PowerShellAdapter.close()
+        with patch("wt2.core.connection.TerminalConnection") as mock_cls:
+            mock_cls.return_value.is_connected = True
+            mock_cls.return_value.send_message.return_value = {"version": "7.4.0"}
+
+            PowerShellAdapter().get_version()
+            PowerShellAdapter().get_prompt()
+            assert mock_cls.call_count == 1
+
+            PowerShellAdapter.close()
+            mock_cls.return_value.disconnect.assert_called_once()
+
+
+class TestPowerShellShellAdapter:
+    """Tests for the subprocess-based PowerShell shell adapter."""
+
+    def test_is_available_cached(self):
+        """Test availability probe is reused within the TTL."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "_probe", return_value=True) as mock_probe:
+            assert adapter.is_available() is True
+            assert adapter.is_available() is True
+            assert mock_probe.call_count == 1
+
+            adapter._available_at -= adapter.AVAILABILITY_TTL
+            adapter.is_available()
+            assert mock_probe.call_count == 2
+
+    def test_version_queried_once(self):
+        """Test version lookup is memoized."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "_query_version", return_value="7.4.0") as mock_query:
+            assert adapter._get_version() == "7.4.0"
+            assert adapter._get_version() == "7.4.0"
+            assert mock_query.call_count == 1
+
+    def test_execute_reuses_worker(self):
+        """Test commands are streamed to one long-lived PowerShell process."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "is_available", return_value=True), \
+                patch("wt2.adapter.powershell.uuid.uuid4") as mock_uuid, \
+                patch("wt2.adapter.powershell.subprocess.Popen") as mock_popen:
+            mock_uuid.return_value = MagicMock(hex="abc")
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([
+                b"C:\\Users\\Test\r\n",
+                b"<<<EOF:abc>>> 0\r\n",
+                b"<<<EOF:abc>>> 1\r\n",
+            ])
+            mock_proc.stderr = iter([
+                b"<<<EOF:abc>>>\r\n",
+                b"Get-Item: not found\r\n",
+                b"<<<EOF:abc>>>\r\n",
+            ])
+            mock_popen.return_value = mock_proc
+
+            first = adapter.execute("(Get-Location).Path")
+            second = adapter.execute("Get-Item missing")
+
+            assert first["stdout"] == "C:\\Users\\Test\n"
+            assert first["success"] is True
+            assert second["exit_code"] == 1
+            assert second["stderr"] == "Get-Item: not found\n"
+            assert mock_popen.call_count == 1
+            command = mock_proc.stdin.write.call_args[0][0].decode()
+            assert command.startswith("$null | . { & {Get-Item missing} }\n")
+
+    def test_worker_exit_is_not_rerun(self):
+        """Test a worker that dies mid-command reports an error."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "is_available", return_value=True), \
+                patch("wt2.adapter.powershell.subprocess.Popen") as mock_popen:
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([b"partial\r\n"])
+            mock_proc.stderr = iter([])
+            mock_popen.return_value = mock_proc
+
+            result = adapter.execute("exit 3")
+
+            assert result["success"] is False
+            assert result["exit_code"] == -1
+            assert result["stdout"] == "partial\n"
+            assert mock_popen.call_count == 1
+
+    def test_set_environment_single_command(self):
+        """Test variables are assigned in one escaped command."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True}
+
+            assert adapter.set_environment("s1", A="1", B="it's") is True
+            mock_execute.assert_called_once_with(
+                "$env:A = '1'; $env:B = 'it''s'", capture=False
+            )
+
+    def test_execute_async_timeout_kills_process(self):
+        """Test async execution reports a timeout and reaps the process."""
+        import asyncio
+        import sys
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter(executable=sys.executable)
+        adapter._command_argv = (sys.executable, "-c", "import time; time.sleep(30)", "--")
+        with patch.object(adapter, "is_available") as mock_available:
+            result = asyncio.run(
+                adapter.execute_async("Start-Sleep 30", timeout=0.5, assume_available=True)
+            )
+            mock_available.assert_not_called()
+
+            assert result["exit_code"] == -1
+            assert result["stderr"] == "Command timed out"
+
+    def test_invoke_expression_skips_json_for_scalars(self):
+        """Test ConvertTo-Json is only used for structured results."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True, "stdout": "42\n"}
+
+            assert adapter.invoke_expression("40 + 2")["result"] == "42"
+            mock_execute.assert_called_with("40 + 2")
+
+            adapter.invoke_expression("Get-Item .", structured=True)
+            mock_execute.assert_called_with("(Get-Item .) | ConvertTo-Json -Depth 1")
+
+    def test_invoke_command_quotes_arguments(self):
+        """Test arguments and string parameters are single-quoted."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            adapter.invoke_command(
+                "Get-ChildItem",
+                args=["C:\\it's"],
+                parameters={"Filter": "*.txt", "Depth": 2},
+            )
+            mock_execute.assert_called_once_with(
+                "Get-ChildItem 'C:\\it''s' -Filter '*.txt' -Depth 2"
+            )
+
+    def test_end_session_uses_session_table(self):
+        """Test teardown kills and reaps the process recorded by start_session."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch("wt2.adapter.powershell.subprocess.Popen") as mock_popen, \
+                patch("wt2.adapter.powershell._kill_tree", return_value=True) as mock_kill:
+            running = MagicMock(pid=4242)
+            running.poll.return_value = None
+            exited = MagicMock(pid=4343)
+            exited.poll.return_value = 0
+            mock_popen.side_effect = [running, exited]
+
+            session_id = adapter.start_session()
+            assert ":" not in session_id
+            assert adapter.end_session(session_id) is True
+            mock_kill.assert_called_once_with(4242)
+            running.wait.assert_called_once()
+            assert adapter.end_session(session_id) is False
+            assert adapter.end_session("bogus:1") is False
+
+            # An exited child is only reaped; its pid may belong to someone else
+            assert adapter.end_session(adapter.start_session()) is True
+            mock_kill.assert_called_once_with(4242)
+            exited.wait.assert_called_once()
+
+    def test_get_environment_batches_variables(self):
+        """Test requested variables are fetched with one command."""
+        from wt2.adapter.powershell import PowerShellAdapter
+
+        adapter = PowerShellAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": '{"HOME":"C:\\\\Users\\\\me","MISSING":null}\n',
+            }
+
+            env = adapter.get_environment("s1", "HOME", "MISSING")
+            assert env == {"HOME": "C:\\Users\\me"}
+            mock_execute.assert_called_once()
+            assert "@('HOME','MISSING')" in mock_execute.call_args[0][0]
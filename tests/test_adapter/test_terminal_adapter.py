@@ -179,3 +179,75 @@ class TestWSLAdapter:
 
             result = adapter.execute_windows_command("notepad.exe")
             assert result["success"] is True
+
+
+class TestWindowsTerminalShellAdapter:
+    """Tests for the Windows Terminal shell adapter."""
+
+    def test_is_available_cached(self, tmp_path):
+        """Test availability follows the shared CLI's wt.exe and is cached."""
+        from wt2.adapter.terminal import TerminalAdapter
+        from wt2.core import terminal as core_terminal
+
+        with patch.object(core_terminal.WindowsTerminalCLI, "_find_wt"):
+            cli = core_terminal.WindowsTerminalCLI()
+        cli._wt_path = str(tmp_path / "wt.exe")
+
+        adapter = TerminalAdapter()
+        with patch.object(core_terminal, "_cli_instance", cli), \
+                patch("wt2.adapter.terminal.shutil.which", return_value=None) as mock_which:
+            assert adapter.is_available() is False
+            (tmp_path / "wt.exe").write_bytes(b"")
+            assert adapter.is_available() is False
+            assert mock_which.call_count == 1
+
+            adapter._avail_cache = None
+            assert adapter.is_available() is True
+
+    def test_adapters_share_cli_instance(self):
+        """Test every adapter attaches to the one shared CLI instance."""
+        from wt2.adapter.terminal import TerminalAdapter
+
+        first = TerminalAdapter()
+        second = TerminalAdapter()
+        with patch("wt2.adapter.terminal.get_cli") as mock_get_cli:
+            assert first.connect() is True
+            assert second.connect() is True
+            assert first._api is second._api is mock_get_cli.return_value
+
+            first.disconnect()
+            assert first._connected is False
+            assert second._api is mock_get_cli.return_value
+
+    def test_execute_batch_uses_shared_cli(self):
+        """Test batches run through the real shared CLI without connecting."""
+        import subprocess
+        from wt2.adapter.terminal import TerminalAdapter
+        from wt2.core import terminal as core_terminal
+
+        with patch.object(core_terminal.WindowsTerminalCLI, "_find_wt"):
+            cli = core_terminal.WindowsTerminalCLI()
+        cli._wt_path = "wt.exe"
+
+        adapter = TerminalAdapter()
+        with patch.object(core_terminal, "_cli_instance", cli), \
+                patch.object(cli, "_run_wt") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+
+            result = adapter.execute_batch([["new-tab"], ["split-pane", "-V"]])
+
+            assert result["success"] is True
+            assert result["exit_code"] == 0
+            mock_run.assert_called_once_with(["new-tab", ";", "split-pane", "-V"], timeout=10.0)
+            assert adapter._connected is False
+
+    def test_start_session_fallback_ids_unique(self):
+        """Test tabs without a reported id still get distinct session ids."""
+        from wt2.adapter.terminal import TerminalAdapter
+
+        adapter = TerminalAdapter()
+        adapter._connected = True
+        adapter._api = MagicMock()
+        adapter._api.new_tab.return_value = {}
+
+        assert adapter.start_session() != adapter.start_session()
@@ -88,6 +88,18 @@ class TestWSLAdapterSpecific:
         result = adapter._convert_windows_path("C:\\Program Files")
         assert "Program" in result or "Files" in result
 
+    def test_wsl_convert_path_exact(self):
+        """Test drive paths map onto /mnt without doubled separators."""
+        from wt2.adapters.wsl_adapter import WSLAdapter
+
+        adapter = WSLAdapter()
+
+        assert adapter._convert_windows_path("C:\\Users\\Test") == "/mnt/c/Users/Test"
+        assert adapter._convert_windows_path("D:/data\\logs") == "/mnt/d/data/logs"
+        assert adapter._convert_windows_path("E:") == "/mnt/e/"
+        assert adapter._convert_windows_path("\\\\server\\share") == "\\\\server\\share"
+        assert adapter._convert_windows_path("/home/user") == "/home/user"
+
     def test_wsl_export_distro(self):
         """Test exporting WSL distribution."""
         from wt2.adapters.wsl_adapter import WSLAdapter
@@ -152,3 +164,348 @@ class TestWSLAdapterSpecific:
 
             result = adapter.terminate_distro("Ubuntu")
             assert result["success"] is True
+
+
+    def test_wsl_connection_is_shared(self):
+        """Test adapter calls reuse one lazily opened connection."""
+        from wt2.adapters import wsl_adapter
+
+        wsl_adapter._close_conn()
+        with patch("wt2.core.connection.TerminalConnection") as mock_cls:
+            mock_cls.return_value.is_connected = True
+            mock_cls.return_value.send_message.return_value = {"prompt": "$ "}
+
+            adapter = wsl_adapter.WSLAdapter()
+            adapter.get_prompt()
+            adapter.list_distributions()
+            adapter.execute_command("ls")
+            assert mock_cls.call_count == 1
+
+            wsl_adapter._close_conn()
+            mock_cls.return_value.disconnect.assert_called_once()
+
+    def test_wsl_admin_calls_send_argv_once(self):
+        """Test admin helpers send a single quoted wsl.exe command line."""
+        from wt2.adapters import wsl_adapter
+
+        wsl_adapter._close_conn()
+        with patch("wt2.core.connection.TerminalConnection") as mock_cls:
+            mock_cls.return_value.is_connected = True
+            send = mock_cls.return_value.send_message
+            send.return_value = {"success": True}
+
+            adapter = wsl_adapter.WSLAdapter()
+            adapter.export_distro("Ubuntu", "C:\\My Backups\\u.tar")
+            send.assert_called_with({
+                "action": "sendInput",
+                "input": 'wsl.exe --export Ubuntu "C:\\My Backups\\u.tar"',
+            })
+
+            adapter.run_as_user("root", "ls -la /root | grep \"it's\"")
+            send.assert_called_with({
+                "action": "sendInput",
+                "input": 'wsl.exe --user root -e sh -c "ls -la /root | grep \\"it\'s\\""',
+            })
+            assert send.call_count == 2
+
+        wsl_adapter._close_conn()
+
+
+class TestWSLShellAdapter:
+    """Tests for the subprocess-based WSL shell adapter."""
+
+    def test_availability_and_distributions_cached(self):
+        """Test wsl.exe --list runs once until the cache is invalidated."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch("wt2.adapter.wsl.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout="Ubuntu\r\nDebian\r\n".encode("utf-16-le")
+            )
+
+            assert adapter.is_available() is True
+            assert adapter.is_available() is True
+            assert adapter.get_distributions() == ["Ubuntu", "Debian"]
+            assert mock_run.call_count == 1
+
+            adapter.shutdown()
+            assert adapter.is_available() is True
+            assert mock_run.call_count == 3
+
+    def test_version_queried_once(self):
+        """Test the WSL version is memoized."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch("wt2.adapter.wsl.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"WSL version: 2.1.5\n")
+
+            assert adapter._get_wsl_version() == "WSL version: 2.1.5"
+            assert adapter._get_wsl_version() == "WSL version: 2.1.5"
+            assert mock_run.call_count == 1
+
+    def test_snapshot_uses_single_invocation(self):
+        """Test state probes are batched into one wsl.exe call."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "1\n\x1e0\x1e/home/me\n\x1e0\x1e\n\x1e0\x1eHOME=/home/me\nA=b=c\n\x1e0\x1e",
+                "stderr": "",
+                "exit_code": 0,
+            }
+
+            assert adapter.snapshot("s1") == {
+                "cwd": "/home/me",
+                "exit_code": 1,
+                "prompt": "wsl$ ",
+                "environment": {"HOME": "/home/me", "A": "b=c"},
+            }
+            mock_execute.assert_called_once()
+
+    def test_execute_reuses_persistent_shell(self):
+        """Test commands are fed to one long-lived bash process."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        adapter._available = True
+        adapter._available_at = float("inf")
+        with patch("wt2.adapter.wsl.uuid.uuid4") as mock_uuid, \
+                patch("wt2.adapter.wsl.os.write", side_effect=lambda fd, data: len(data)), \
+                patch("wt2.adapter.wsl.subprocess.Popen") as mock_popen:
+            mock_uuid.return_value = MagicMock(hex="abc")
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([
+                b"/home/me\n",
+                b"\n",
+                b"__WT2_END_abc__0\n",
+                b"\n",
+                b"__WT2_END_abc__2\n",
+            ])
+            mock_popen.return_value = mock_proc
+
+            first = adapter.execute("pwd")
+            second = adapter.execute("ls missing")
+
+            assert first["stdout"] == "/home/me\n"
+            assert first["success"] is True
+            assert second["exit_code"] == 2
+            assert mock_popen.call_count == 1
+
+    def test_execute_reports_shell_exit_without_rerun(self):
+        """Test a bash process that dies mid-command is not re-run."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        writes = []
+        with patch("wt2.adapter.wsl.os.write", side_effect=lambda fd, data: writes.append(bytes(data)) or len(data)), \
+                patch("wt2.adapter.wsl.subprocess.Popen") as mock_popen, \
+                patch.object(adapter, "_execute_once") as mock_once:
+            mock_proc = MagicMock()
+            mock_proc.poll.return_value = None
+            mock_proc.stdout = iter([b"bye\n"])
+            mock_popen.return_value = mock_proc
+
+            result = adapter.execute("echo bye; exit")
+
+            assert result["success"] is False
+            assert result["stdout"] == "bye\n"
+            assert result["exit_code"] == -1
+            mock_once.assert_not_called()
+            assert writes[0].startswith(b"{ echo bye; exit\n} </dev/null\n")
+
+    def test_mount_windows_paths_filters_in_python(self):
+        """Test mount output is parsed without a grep pipeline."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": (
+                    "//server/share on /mnt/share type cifs (rw)\n"
+                    "none on /usr/lib/wsl type tmpfs (rw) wsl\n"
+                    "/dev/sdc on / type ext4 (rw)\n"
+                ),
+            }
+
+            assert adapter.mount_windows_paths() == {
+                "/mnt/share": "//server/share",
+                "/usr/lib/wsl": "none",
+            }
+            mock_execute.assert_called_once_with("mount")
+
+    def test_build_env_only_copies_with_overrides(self):
+        """Test the environment is inherited unless the caller overrides it."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        adapter._base_env = {"KEEP": "1"}
+
+        assert adapter._build_env(None) is None
+        assert adapter._build_env({"PROJ": "C:\\work", "X": "y"}) == {
+            "KEEP": "1",
+            "PROJ": "/mnt/c/work",
+            "X": "y",
+        }
+
+    def test_path_conversion_is_memoized(self):
+        """Test repeated conversions hit the adapter's path cache."""
+        from wt2.adapter import wsl
+
+        wsl._windows_to_wsl.cache_clear()
+        adapter = wsl.WSLAdapter()
+
+        assert adapter.convert_path_to_wsl("C:\\work") == "/mnt/c/work"
+        assert adapter.convert_path_to_wsl("C:\\work") == "/mnt/c/work"
+        assert wsl._windows_to_wsl.cache_info().hits == 1
+
+    def test_prefetch_info_runs_probes_concurrently(self):
+        """Test info probes are gathered and fill the sync caches."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter(executable="wsl.exe")
+
+        async def fake_run(*args, timeout=5):
+            if args[0] == "--list":
+                return "Ubuntu\r\n".encode("utf-16-le")
+            return b"WSL version: 2.1.5\n"
+
+        with patch.object(adapter, "_run_async", side_effect=fake_run) as mock_run, \
+                patch("wt2.adapter.wsl.subprocess.run") as mock_sync:
+            info = adapter.prefetch_info()
+
+            assert info.name == "WSL (Ubuntu)"
+            assert info.version == "WSL version: 2.1.5"
+            assert info.is_available is True
+            assert mock_run.call_count == 2
+            mock_sync.assert_not_called()
+
+    def test_execute_with_cwd_uses_cd_flag(self):
+        """Test the working directory is passed to wsl.exe, not to bash."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter(distribution="Ubuntu")
+        adapter._available = True
+        adapter._available_at = float("inf")
+        with patch("wt2.adapter.wsl.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+            adapter.execute("ls", cwd="C:\\it's here")
+
+            assert mock_run.call_args[0][0] == [
+                "wsl.exe", "--distribution", "Ubuntu",
+                "--cd", "/mnt/c/it's here",
+                "bash", "-c", "ls",
+            ]
+
+    def test_get_environment_keeps_values_verbatim(self):
+        """Test printenv values keep '=' and surrounding spaces."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "A=b=c\nPAD= x \nnot a var\n",
+            }
+
+            assert adapter.get_environment("s1") == {"A": "b=c", "PAD": " x "}
+
+    def test_get_environment_filters_in_wsl(self):
+        """Test requested variables are selected inside WSL."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True, "stdout": "HOME=/home/me\0MULTI=a\nb\0"}
+
+            env = adapter.get_environment("s1", "HOME", "MULTI", "bad;name")
+            assert env == {"HOME": "/home/me", "MULTI": "a\nb"}
+            command = mock_execute.call_args[0][0]
+            assert command.startswith("for n in HOME MULTI; do")
+            assert "printenv" not in command
+
+    def test_decode_keeps_nul_separated_output_utf8(self):
+        """Test Linux output with NULs is not mistaken for UTF-16."""
+        from wt2.adapter import wsl
+
+        assert wsl._decode(b"HOME=/root\x00USER=me\x00") == "HOME=/root\x00USER=me\x00"
+        assert wsl._decode_wsl_exe("Ubuntu\r\n".encode("utf-16-le")) == "Ubuntu\r\n"
+        assert wsl._decode_wsl_exe(b"Ubuntu\n") == "Ubuntu\n"
+
+    def test_end_session_terminates_stored_process(self):
+        """Test teardown uses the session's Popen and forgets it."""
+        import subprocess
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        process = MagicMock()
+        process.wait.side_effect = [subprocess.TimeoutExpired("wsl.exe", 2), 0]
+        adapter._sessions["abc:1234"] = process
+
+        assert adapter.end_session("abc:1234") is True
+        process.terminate.assert_called_once_with()
+        process.kill.assert_called_once_with()
+        assert "abc:1234" not in adapter._sessions
+        assert adapter.end_session("abc:1234") is False
+
+    def test_execute_without_availability_probe(self):
+        """Test execute reports a missing wsl.exe without probing first."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter(executable="definitely-not-wsl.exe")
+        with patch.object(adapter, "is_available") as mock_available:
+            result = adapter.execute("ls")
+
+            assert result["success"] is False
+            assert result["stderr"] == "WSL not available"
+            assert adapter.run_windows_command("dir")["stderr"] == "WSL not available"
+            mock_available.assert_not_called()
+
+    def test_shell_arguments_are_quoted(self):
+        """Test paths and values are shell-quoted before reaching bash."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch.object(adapter, "execute") as mock_execute:
+            mock_execute.return_value = {"success": True}
+
+            adapter.change_directory("s1", "C:\\it's $HOME")
+            mock_execute.assert_called_with("cd '/mnt/c/it'\"'\"'s $HOME'")
+
+            adapter.set_environment("s1", A="x y", B='say "hi"')
+            mock_execute.assert_called_with("export A='x y' B='say \"hi\"'")
+
+    def test_argv_prefix_follows_distribution(self):
+        """Test the cached wsl.exe prefix is rebuilt when the distro changes."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter(default_user="dev")
+        assert adapter._prefix_argv == ("wsl.exe", "--user", "dev")
+
+        adapter.distribution = "Debian"
+        assert adapter._prefix_argv == ("wsl.exe", "--distribution", "Debian", "--user", "dev")
+        assert adapter._distro_argv == ("wsl.exe", "--distribution", "Debian")
+
+    def test_send_input_writes_raw_bytes(self):
+        """Test session input goes straight to the stdin descriptor."""
+        from wt2.adapter.wsl import WSLAdapter
+
+        adapter = WSLAdapter()
+        with patch("wt2.adapter.wsl.subprocess.Popen") as mock_popen, \
+                patch("wt2.adapter.wsl.os.write", side_effect=lambda fd, data: len(data)) as mock_write:
+            mock_proc = MagicMock(pid=77)
+            mock_proc.poll.return_value = None
+            mock_proc.stdin.fileno.return_value = 9
+            mock_popen.return_value = mock_proc
+
+            session_id = adapter.start_session()
+            assert adapter.send_input(session_id, "ls\n") is True
+            assert bytes(mock_write.call_args[0][1]) == b"ls\n"
+            assert mock_write.call_args[0][0] == 9
+            assert adapter.send_input("unknown:1", "ls\n") is False
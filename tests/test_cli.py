@@ -31,6 +31,43 @@ class TestCLI:
         # Should show help or error gracefully
         assert result.exit_code in [0, 1]
 
+    def test_main_version_fast_path(self, capsys):
+        """Test a bare version flag is answered without dispatching Click."""
+        from unittest.mock import patch
+        from wt2 import __version__
+        from wt2.cli import main
+
+        for flag in ("--version", "-V"):
+            with patch("sys.argv", ["wt2", flag]), patch("wt2.cli.cli") as mock_cli:
+                assert main() == 0
+                mock_cli.assert_not_called()
+            assert capsys.readouterr().out == f"winterm2 version {__version__}\n"
+
+    def test_subcommands_resolved_lazily(self):
+        """Test subcommand groups are imported through LazyGroup."""
+        import click
+        from wt2.cli import cli, LazyGroup
+
+        ctx = click.Context(cli)
+        assert isinstance(cli, LazyGroup)
+        assert {"window", "tab", "pane", "config", "send"} <= set(cli.list_commands(ctx))
+
+        tab = cli.get_command(ctx, "tab")
+        assert isinstance(tab, click.Group)
+        assert cli.get_command(ctx, "tab") is tab
+        assert cli.get_command(ctx, "missing") is None
+
+    def test_command_submodules_stay_modules(self):
+        """Test resolving a group does not shadow its submodule."""
+        import types
+        import click
+        from wt2.cli import cli
+
+        cli.get_command(click.Context(cli), "pane")
+        from wt2.commands import pane
+
+        assert isinstance(pane, types.ModuleType)
+
 
 class TestWindowCommands:
     """Test window-related commands."""
@@ -0,0 +1,91 @@
+"""Unit tests for broadcast commands."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from click.testing import CliRunner
+
+
+class TestBroadcastCommands:
+    """Test broadcast command functions."""
+
+    def test_send_uses_bulk_call(self):
+        """Test a broadcast reaches every pane with one bulk send."""
+        from wt2.commands.broadcast import broadcast
+
+        api = MagicMock()
+        api.send_text_bulk.return_value = {"success": True, "error": None}
+
+        result = CliRunner().invoke(broadcast, ["send", "git", "pull", "--panes", "1,2"], obj={"api": api})
+
+        assert result.exit_code == 0
+        assert "Sent to 2/2 panes" in result.output
+        api.send_text_bulk.assert_called_once_with([("1", "git pull"), ("2", "git pull")])
+        api.send_text.assert_not_called()
+
+    def test_send_falls_back_per_pane(self):
+        """Test a bulk send that never launched is retried pane by pane."""
+        from wt2.commands.broadcast import broadcast
+
+        api = MagicMock()
+        api.send_text_bulk.return_value = {"success": False, "error": "unsupported", "launched": False}
+        api.async_send_text = AsyncMock(side_effect=[{"success": True}, {}])
+
+        result = CliRunner().invoke(broadcast, ["send", "ls", "--panes", "1,2"], obj={"api": api})
+
+        assert "Sent to 1/2 panes" in result.output
+        assert api.async_send_text.await_count == 2
+        api.send_text.assert_not_called()
+
+    def test_send_failed_batch_is_not_resent(self):
+        """Test a batch that failed after launch is reported, not resent."""
+        from wt2.commands.broadcast import broadcast
+
+        api = MagicMock()
+        api.send_text_bulk.return_value = {"success": False, "error": "Command timed out", "launched": True}
+        api.async_send_text = AsyncMock()
+
+        result = CliRunner().invoke(broadcast, ["send", "rm", "x", "--panes", "1,2"], obj={"api": api})
+
+        assert result.exit_code == 2
+        assert "Broadcast failed: Command timed out" in result.output
+        assert "Sent to" not in result.output
+        api.async_send_text.assert_not_called()
+        api.send_text.assert_not_called()
+
+    def test_translate_command(self):
+        """Test generic commands map to shell-specific ones."""
+        from wt2.commands.broadcast import _translate_command
+
+        assert _translate_command("cmd", "clear") == "cls"
+        assert _translate_command("powershell", "ls") == "Get-ChildItem"
+        assert _translate_command("cmd", "git pull") == "git pull"
+
+    def test_pane_ids_filters_tabs(self):
+        """Test pane collection across all tabs or selected tabs."""
+        from wt2.commands.broadcast import _pane_ids
+
+        state = {"tabs": [
+            {"id": 1, "panes": [{"id": "a"}, {"id": "b"}]},
+            {"id": 2, "panes": [{"id": "c"}, {}]},
+        ]}
+
+        assert _pane_ids(state) == ["a", "b", "c"]
+        assert _pane_ids(state, frozenset({"2"})) == ["c"]
+        assert _pane_ids({}) == []
+
+    def test_on_tabs_selects_matching_panes(self):
+        """Test --tabs enables broadcast for panes of the listed tabs only."""
+        from wt2.commands.broadcast import broadcast
+
+        api = MagicMock()
+        api.get_state.return_value = {"tabs": [
+            {"id": 1, "panes": [{"id": "a"}]},
+            {"id": 2, "panes": [{"id": "b"}]},
+            {"id": 3, "panes": [{"id": "c"}]},
+        ]}
+        obj = {"api": api}
+
+        result = CliRunner().invoke(broadcast, ["on", "--tabs", "1,3"], obj=obj)
+
+        assert result.exit_code == 0
+        assert obj["broadcast_targets"] == ["a", "c"]
@@ -0,0 +1,233 @@
+"""Unit tests for config commands."""
+
+import pytest
+from unittest.mock import patch
+from click.testing import CliRunner
+
+
+class TestConfigCommands:
+    """Test config command functions."""
+
+    def test_load_reuses_parse_until_file_changes(self, tmp_path):
+        """Test an unchanged config file is parsed only once."""
+        import yaml
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        path.write_text("version: '1.0'\nprofiles:\n  dev: {}\n", encoding="utf-8")
+        config_mod._YAML_CACHE.clear()
+
+        with patch("wt2.commands.config.yaml.load", wraps=yaml.load) as mock_load:
+            obj = {}
+            CliRunner().invoke(config_mod.config, ["load", str(path)], obj=obj)
+            CliRunner().invoke(config_mod.config, ["reload"], obj=obj)
+            assert mock_load.call_count == 1
+            assert obj["config"]["profiles"] == {"dev": {}}
+
+            path.write_text("version: '2.0'\nprofiles: {}\n", encoding="utf-8")
+            CliRunner().invoke(config_mod.config, ["reload"], obj=obj)
+            assert mock_load.call_count == 2
+            assert obj["config"] == {"version": "2.0", "profiles": {}}
+
+    def test_cached_config_is_not_shared(self, tmp_path):
+        """Test mutating a loaded config does not corrupt the cache."""
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        path.write_text("defaults:\n  shell: cmd\n", encoding="utf-8")
+        config_mod._YAML_CACHE.clear()
+
+        obj = {}
+        CliRunner().invoke(config_mod.config, ["load", str(path)], obj=obj)
+        CliRunner().invoke(config_mod.config, ["set", "defaults.shell", "pwsh"], obj=obj)
+        CliRunner().invoke(config_mod.config, ["reload"], obj=obj)
+
+        assert obj["config"]["defaults"]["shell"] == "cmd"
+
+    def test_load_missing_file(self, tmp_path):
+        """Test a missing config file exits with code 2."""
+        from wt2.commands.config import config
+
+        result = CliRunner().invoke(config, ["load", str(tmp_path / "missing.yaml")], obj={})
+        assert result.exit_code == 2
+
+    def test_init_save_round_trip(self, tmp_path):
+        """Test files written by init and save load back unchanged."""
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        obj = {}
+        CliRunner().invoke(config_mod.config, ["init", str(path)], obj=obj)
+        CliRunner().invoke(config_mod.config, ["load", str(path)], obj=obj)
+        CliRunner().invoke(config_mod.config, ["set", "defaults.size", "[120, 40]"], obj=obj)
+        CliRunner().invoke(config_mod.config, ["save"], obj=obj)
+
+        saved = obj["config"]
+        CliRunner().invoke(config_mod.config, ["reload"], obj=obj)
+        assert obj["config"] == saved
+        assert obj["config"]["defaults"]["size"] == [120, 40]
+        assert path.read_text(encoding="utf-8").startswith("version: '1.0'")
+
+    def test_parse_yaml_leaves_no_files_behind(self, tmp_path):
+        """Test parsing only reads the config and reports its source digest."""
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        path.write_bytes(b"profiles:\n  dev: {shell: wsl}\n")
+
+        data, digest = config_mod._parse_yaml(path)
+
+        assert data == {"profiles": {"dev": {"shell": "wsl"}}}
+        assert digest == config_mod._digest(path.read_bytes())
+        assert [p.name for p in tmp_path.iterdir()] == ["wt2rc.yaml"]
+
+    def test_get_reads_live_config(self, tmp_path):
+        """Test dotted lookups after load, after set and after direct edits."""
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        path.write_text("defaults:\n  shell: cmd\n  window: {size: [80, 24]}\n", encoding="utf-8")
+
+        obj = {}
+        runner = CliRunner()
+        runner.invoke(config_mod.config, ["load", str(path)], obj=obj)
+
+        assert runner.invoke(config_mod.config, ["get", "defaults.shell"], obj=obj).output == '"cmd"\n'
+        assert '"shell": "cmd"' in runner.invoke(config_mod.config, ["get", "defaults"], obj=obj).output
+
+        runner.invoke(config_mod.config, ["set", "defaults.window", "{title: dev}"], obj=obj)
+        assert runner.invoke(config_mod.config, ["get", "defaults.window.title"], obj=obj).output == '"dev"\n'
+        assert runner.invoke(config_mod.config, ["get", "defaults.window.size"], obj=obj).exit_code != 0
+
+        # Other commands (e.g. window save) write ctx.obj["config"] directly
+        obj["config"]["arrangements"] = {"work": {"tabs": 2}}
+        assert runner.invoke(config_mod.config, ["get", "arrangements.work.tabs"], obj=obj).output == "2\n"
+
+    def test_save_skips_unchanged_file(self, tmp_path):
+        """Test saving a config identical to the file on disk does not rewrite it."""
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        obj = {}
+        runner = CliRunner()
+        runner.invoke(config_mod.config, ["init", str(path)], obj=obj)
+        runner.invoke(config_mod.config, ["load", str(path)], obj=obj)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            result = runner.invoke(config_mod.config, ["save"], obj=obj)
+            assert "Configuration unchanged" in result.output
+            assert not any(c.args[1:2] == ("wb",) for c in mock_open.call_args_list)
+
+        runner.invoke(config_mod.config, ["set", "defaults.shell", "cmd"], obj=obj)
+        result = runner.invoke(config_mod.config, ["save"], obj=obj)
+        assert "Saved configuration to" in result.output
+        assert "shell: cmd" in path.read_text(encoding="utf-8")
+
+    def test_alias_invokes_command_directly(self):
+        """Test aliases dispatch to the target command without re-running the CLI."""
+        import sys
+        from wt2.commands import config as config_mod
+
+        obj = {"config": {"aliases": {"where": "wt2 config path", "bad": "wt2 nope"}}}
+        argv = list(sys.argv)
+
+        result = CliRunner().invoke(config_mod.config, ["alias", "where"], obj=obj)
+        assert result.exit_code == 0
+        assert str(config_mod.DEFAULT_CONFIG_PATH) in result.output
+        assert sys.argv == argv
+
+        result = CliRunner().invoke(config_mod.config, ["alias", "bad"], obj=obj)
+        assert result.exit_code == 4
+
+    def test_alias_passes_group_options(self):
+        """Test aliases may start with root options before the command."""
+        from wt2.commands import config as config_mod
+
+        obj = {"config": {"aliases": {"where": "wt2 --profile work --shell cmd config path"}}}
+
+        result = CliRunner().invoke(config_mod.config, ["alias", "where"], obj=obj)
+        assert result.exit_code == 0
+        assert str(config_mod.DEFAULT_CONFIG_PATH) in result.output
+        assert obj["profile"] == "work"
+        assert obj["shell"] == "cmd"
+
+    def test_compile_getter(self):
+        """Test compiled dotted-key accessors are cached and strict."""
+        from wt2.commands import config as config_mod
+
+        getter = config_mod._compile_getter("profiles.dev")
+        assert config_mod._compile_getter("profiles.dev") is getter
+        assert getter({"profiles": {"dev": {"shell": "wsl"}}}) == {"shell": "wsl"}
+        with pytest.raises(KeyError):
+            getter({"profiles": {}})
+        with pytest.raises(TypeError):
+            getter({"profiles": ["dev"]})
+
+    def test_edit_reloads_and_drops_stale_parses(self, tmp_path):
+        """Test a successful edit reloads the file and evicts old cache entries."""
+        from wt2.commands import config as config_mod
+
+        path = tmp_path / "wt2rc.yaml"
+        path.write_text("version: '1.0'\n", encoding="utf-8")
+        config_mod._YAML_CACHE.clear()
+        obj = {}
+        CliRunner().invoke(config_mod.config, ["load", str(path)], obj=obj)
+
+        def fake_editor(argv, check):
+            path.write_text("version: '2.0'\nprofiles: {}\n", encoding="utf-8")
+            return type("Result", (), {"returncode": 0})()
+
+        with patch("wt2.commands.config.subprocess.run", side_effect=fake_editor), \
+                patch("wt2.commands.config.os.execvp") as mock_exec:
+            result = CliRunner().invoke(config_mod.config, ["edit"], obj=obj)
+            mock_exec.assert_not_called()
+
+        assert result.exit_code == 0
+        assert obj["config"] == {"version": "2.0", "profiles": {}}
+        assert [k[0] for k in config_mod._YAML_CACHE] == [str(path)]
+
+    def test_list_single_echo(self):
+        """Test the config listing is written in one echo call."""
+        from wt2.commands import config as config_mod
+
+        obj = {"config": {"version": "1.0", "profiles": {f"p{i}": {} for i in range(7)}}}
+        with patch("wt2.commands.config.click.echo") as mock_echo:
+            CliRunner().invoke(config_mod.config, ["list"], obj=obj)
+
+        mock_echo.assert_called_once()
+        assert mock_echo.call_args.args[0].splitlines() == [
+            "Configuration:",
+            "-" * 40,
+            "  version: 1.0",
+            "  profiles:",
+            "    - p0", "    - p1", "    - p2", "    - p3", "    - p4",
+            "    ... (7 total items)",
+        ]
+
+    def test_set_creates_missing_sections(self):
+        """Test set builds intermediate sections and get walks them back."""
+        from wt2.commands import config as config_mod
+
+        obj = {"config": {"defaults": {"shell": "cmd"}}}
+        runner = CliRunner()
+        runner.invoke(config_mod.config, ["set", "profiles.dev.shell", "wsl"], obj=obj)
+
+        assert obj["config"] == {"defaults": {"shell": "cmd"}, "profiles": {"dev": {"shell": "wsl"}}}
+        result = runner.invoke(config_mod.config, ["get", "profiles.dev"], obj=obj)
+        assert '"shell": "wsl"' in result.output
+        assert runner.invoke(config_mod.config, ["get", "defaults.shell.x"], obj=obj).exit_code != 0
+
+    def test_init_creates_missing_parent(self, tmp_path):
+        """Test init creates the parent directory only when it is missing."""
+        from wt2.commands import config as config_mod
+
+        nested = tmp_path / "a" / "b" / "wt2rc.yaml"
+        result = CliRunner().invoke(config_mod.config, ["init", str(nested)], obj={})
+        assert result.exit_code == 0
+        assert nested.exists()
+
+        existing = tmp_path / "wt2rc.yaml"
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            CliRunner().invoke(config_mod.config, ["init", str(existing)], obj={})
+            mock_mkdir.assert_not_called()
+        assert existing.read_text(encoding="utf-8").startswith("version: '1.0'")
@@ -0,0 +1,69 @@
+"""Unit tests for monitor commands."""
+
+import pytest
+from unittest.mock import MagicMock
+from click.testing import CliRunner
+
+
+class TestMonitorCommands:
+    """Test monitor command functions."""
+
+    def test_tail_lines(self):
+        """Test the backwards scan matches a full strip-and-split."""
+        from wt2.commands.monitor import _tail_lines
+
+        text = "\n  first\nsecond\r\n\nthird\n\n"
+        for count in range(0, 6):
+            expected = text.strip().split("\n")
+            if count:
+                expected = expected[-count:]
+            assert _tail_lines(text, count) == expected
+        assert _tail_lines(" \n ", 3) == [""]
+
+    def test_tail_command_prints_last_lines(self):
+        """Test tail echoes only the requested number of lines."""
+        from wt2.commands.monitor import monitor
+
+        api = MagicMock()
+        api.send_command.return_value = {"output": "one\ntwo\nthree\n"}
+
+        result = CliRunner().invoke(monitor, ["tail", "2"], obj={"api": api})
+
+        assert result.exit_code == 0
+        assert result.output == "two\nthree\n"
+
+    def test_process_output_keyword_match(self):
+        """Test keyword filtering is case-insensitive and literal."""
+        from wt2.commands.monitor import OutputMonitor
+
+        monitor = OutputMonitor(keyword="Error (x)")
+
+        assert monitor.process_output("fatal ERROR (X) here") is True
+        assert monitor.process_output("error x") is False
+        assert monitor._lines_matched == 1
+        assert monitor._lines_total == 2
+        assert OutputMonitor().process_output("anything") is True
+
+    def test_wait_returns_on_stop_or_timeout(self):
+        """Test wait() wakes as soon as stop() is called and honours timeouts."""
+        import threading
+        import time
+        from wt2.commands.monitor import OutputMonitor
+
+        monitor = OutputMonitor()
+        monitor.start()
+        assert monitor.wait(0.01) is False
+
+        threading.Timer(0.05, monitor.stop).start()
+        started = time.monotonic()
+        assert monitor.wait() is True
+        assert time.monotonic() - started < 0.5
+
+    def test_watch_stops_at_timeout(self):
+        """Test watch returns once its timeout elapses."""
+        from wt2.commands.monitor import monitor
+
+        result = CliRunner().invoke(monitor, ["watch", "error", "--timeout", "0.05"], obj={"api": MagicMock()})
+
+        assert result.exit_code == 0
+        assert "Found 0 match(es)" in result.output
@@ -140,3 +140,60 @@ class TestPaneCommands:
         result = split_pane(direction="invalid")
         assert result["success"] is False
         assert "error" in result
+
+    def test_split_command_uses_context_cli(self):
+        """Test the split command drives the CLI wrapper from ctx.obj."""
+        from click.testing import CliRunner
+        from wt2.commands.pane import pane
+
+        cli = MagicMock()
+        cli.split_pane.return_value = {"success": True}
+
+        result = CliRunner().invoke(pane, ["split", "--direction", "vertical"], obj={"cli": cli})
+
+        assert result.exit_code == 0
+        cli.split_pane.assert_called_once_with(direction="down", profile=None, size=None, pane_id=None)
+
+    def test_split2x2_single_batch(self):
+        """Test the 2x2 grid is created with one chained wt.exe call."""
+        from click.testing import CliRunner
+        from wt2.commands.pane import pane
+
+        cli = MagicMock()
+        cli.run_batch.return_value = {"success": True, "error": None}
+
+        result = CliRunner().invoke(pane, ["split2x2", "--profile", "Ubuntu"], obj={"cli": cli})
+
+        assert result.exit_code == 0
+        cli.run_batch.assert_called_once_with([
+            ["split-pane", "--right", "--profile", "Ubuntu"],
+            ["split-pane", "--down", "--profile", "Ubuntu"],
+        ])
+        cli.split_pane.assert_not_called()
+
+    def test_pane_command_result_handling(self):
+        """Test success, failure and error paths share one exit-code policy."""
+        from click.testing import CliRunner
+        from wt2.commands.pane import pane
+
+        cli = MagicMock()
+        runner = CliRunner()
+
+        cli.resize_pane.return_value = {"success": True}
+        result = runner.invoke(pane, ["resize", "left", "3"], obj={"cli": cli})
+        assert result.exit_code == 0
+        assert "Resized pane left by 3" in result.output
+
+        cli.focus_pane.return_value = {"success": False, "error": "no pane"}
+        result = runner.invoke(pane, ["focus", "up"], obj={"cli": cli})
+        assert result.exit_code == 1
+
+        cli.toggle_pane_zoom.side_effect = OSError("wt.exe missing")
+        result = runner.invoke(pane, ["zoom"], obj={"cli": cli})
+        assert result.exit_code == 2
+
+        cli.split_pane.return_value = {"success": True}
+        result = runner.invoke(pane, ["vsplit"], obj={"cli": cli})
+        assert result.exit_code == 0
+        assert "Split pane (vertical)" in result.output
+        cli.split_pane.assert_called_once_with(direction="down", profile=None, size=None, pane_id=None)
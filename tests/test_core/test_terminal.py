@@ -173,3 +173,108 @@ class TestTerminalAPI:
 
         result = api.get_active_window()
         assert result["id"] == 1
+
+
+class TestWindowsTerminalCLI:
+    """Test the wt.exe command-line interface wrapper."""
+
+    def test_run_batch_single_invocation(self):
+        """Test several subcommands are joined into one wt.exe call."""
+        import subprocess
+        from wt2.core.terminal import WindowsTerminalCLI
+
+        with patch.object(WindowsTerminalCLI, "_find_wt"):
+            cli = WindowsTerminalCLI()
+        cli._wt_path = "wt.exe"
+
+        with patch.object(cli, "_run_wt") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+            result = cli.run_batch([["new-tab", "--title", "a;b"], ["split-pane", "-V"]])
+
+            assert result["success"] is True
+            mock_run.assert_called_once_with(
+                ["new-tab", "--title", "a\\;b", ";", "split-pane", "-V"], timeout=10.0
+            )
+
+    def test_run_batch_reports_whether_wt_launched(self):
+        """Test a missing wt.exe is told apart from a failed or timed-out batch."""
+        import subprocess
+        from wt2.core.terminal import WindowsTerminalCLI
+
+        with patch.object(WindowsTerminalCLI, "_find_wt"):
+            cli = WindowsTerminalCLI()
+        cli._wt_path = "wt.exe"
+
+        with patch("wt2.core.terminal.subprocess.run") as mock_run:
+            mock_run.side_effect = FileNotFoundError
+            result = cli.send_text_bulk([("1", "ls")])
+            assert result == {"success": False, "error": "wt.exe not found", "launched": False}
+
+            mock_run.side_effect = subprocess.TimeoutExpired("wt.exe", 10)
+            result = cli.send_text_bulk([("1", "ls")])
+            assert result["success"] is False
+            assert result["launched"] is True
+
+    def test_submit_and_poll(self):
+        """Test submitted commands are reaped by poll."""
+        from wt2.core.terminal import WindowsTerminalCLI
+
+        with patch.object(WindowsTerminalCLI, "_find_wt"):
+            cli = WindowsTerminalCLI()
+        cli._wt_path = "wt.exe"
+
+        with patch("wt2.core.terminal.subprocess.Popen") as mock_popen:
+            running = MagicMock(returncode=None)
+            running.poll.return_value = None
+            done = MagicMock(returncode=0)
+            done.poll.return_value = 0
+            mock_popen.side_effect = [running, done]
+
+            cli.submit(["new-tab"])
+            cli.submit(["split-pane", "-V"])
+
+            assert cli.poll() == [{"success": True, "error": None}]
+            assert cli._pending == [running]
+
+    def test_send_text_bulk_single_invocation(self):
+        """Test text for several panes is sent with one wt.exe call."""
+        from wt2.core.terminal import WindowsTerminalCLI
+
+        with patch.object(WindowsTerminalCLI, "_find_wt"):
+            cli = WindowsTerminalCLI()
+
+        with patch.object(cli, "run_batch", return_value={"success": True, "error": None}) as mock_batch:
+            assert cli.send_text_bulk([("1", "ls"), ("2", "ls")])["success"] is True
+            mock_batch.assert_called_once_with([
+                ["send-input", "--id", "1", "ls"],
+                ["send-input", "--id", "2", "ls"],
+            ])
+
+    def test_async_send_text_delegates(self):
+        """Test the async send wraps send_text for concurrent use."""
+        import asyncio
+        from wt2.core.terminal import WindowsTerminalCLI
+
+        with patch.object(WindowsTerminalCLI, "_find_wt"):
+            cli = WindowsTerminalCLI()
+
+        with patch.object(cli, "send_text", return_value={"success": True}) as mock_send:
+            result = asyncio.run(cli.async_send_text("ls", pane_id="2"))
+
+        assert result == {"success": True}
+        mock_send.assert_called_once_with("ls", "2")
+
+    def test_get_state_cached_within_ttl(self):
+        """Test state snapshots are reused for STATE_TTL seconds."""
+        from wt2.core.terminal import WindowsTerminalCLI
+
+        with patch.object(WindowsTerminalCLI, "_find_wt"):
+            cli = WindowsTerminalCLI()
+
+        with patch.object(cli, "_query_state", return_value={"tabs": []}) as mock_query:
+            assert cli.get_state() is cli.get_state()
+            assert mock_query.call_count == 1
+
+            cli.invalidate_state()
+            cli.get_state()
+            assert mock_query.call_count == 2